@@ -175,6 +175,8 @@ class DatabasePool:
                     ON chunks (document_id);
                 CREATE INDEX IF NOT EXISTS idx_documents_content_hash
                     ON documents ((metadata->>'content_hash'));
+                CREATE INDEX IF NOT EXISTS idx_documents_graph_ingested
+                    ON documents (((metadata->>'graph_ingested')::BOOLEAN));
                 CREATE INDEX IF NOT EXISTS idx_generated_run_id
                     ON generated_content (run_id);
             """)
@@ -199,6 +199,11 @@ class GraphClient:
                 "CREATE FULLTEXT INDEX edge_name_and_fact IF NOT EXISTS "
                 "FOR ()-[r:RELATES_TO]-() ON EACH [r.name, r.fact]"
             )
+            # Backs the dashboard's paginated Episodes list (ORDER BY created_at).
+            await client.driver.execute_query(
+                "CREATE INDEX episodic_created_at IF NOT EXISTS "
+                "FOR (e:Episodic) ON (e.created_at)"
+            )
             logger.info("Graphiti schema ensured.")
         except Exception:
             logger.exception("Schema setup failed -- continuing anyway")
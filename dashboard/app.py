@@ -1,18 +1,20 @@
 import asyncio
+import atexit
+import json
+import math
 import os
-import tempfile
-import time
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-import nest_asyncio
+import numpy as np
 import pandas as pd
+import plotly.graph_objects as go
 import streamlit as st
 import neo4j
 from neo4j import GraphDatabase
 from pyvis.network import Network
 
-# FIXED: patch the event loop so asyncio.run / await work inside Streamlit
-nest_asyncio.apply()
-
 from agent.db_utils import DatabasePool, get_document_summary
 from agent.tools import graph_search_tool, hybrid_search_tool, vector_search_tool
 from poc.content_generator import get_content_generator
@@ -28,7 +30,8 @@ from poc.logging_utils import (
 from poc.prompts import email, historia, reel_cta
 from poc.run_poc import run_ingestion
 from poc.hydrate_graph import hydrate_graph
-from dashboard.i18n import t, LANGUAGES
+from dashboard.i18n import t, t_plain, tab_labels, LANGUAGES
+from dashboard.utils import read_log
 
 # ---------------------------------------------------------------------------
 # Language selection (must be first use of session_state)
@@ -45,7 +48,7 @@ lang = st.session_state["lang"]
 # ---------------------------------------------------------------------------
 
 st.set_page_config(
-    page_title=t("app.page_title", lang),
+    page_title=t_plain("app.page_title", lang),
     page_icon="🕸️",
     layout="wide",
 )
@@ -60,26 +63,141 @@ def _(key: str, **kwargs) -> str:
 # Helper: run async coroutines safely inside Streamlit
 # ---------------------------------------------------------------------------
 
+@st.cache_resource(show_spinner=False)
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """One event loop per server process, running on a daemon thread.
+
+    Kept alive across reruns so pooled async clients (asyncpg, Graphiti) stay
+    bound to the same loop.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="dashboard-asyncio", daemon=True).start()
+    return loop
+
+
 def run_async(coro):
     """Run an async coroutine from sync Streamlit context."""
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(coro)
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _log_key(filename: str):
+    """(mtime, size) of a log file, or None if it doesn't exist — used as a cache key."""
+    try:
+        stat = os.stat(os.path.join("logs", filename))
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
 def load_log(filename: str) -> pd.DataFrame:
-    path = os.path.join("logs", filename)
-    if os.path.exists(path) and os.path.getsize(path) > 0:
-        try:
-            return pd.read_csv(path)
-        except pd.errors.EmptyDataError:
-            pass
+    key = _log_key(filename)
+    if key and key[1] > 0:
+        return read_log(os.path.join("logs", filename), *key)
     return pd.DataFrame()
 
 
+# log file -> cost column, and the per-unit estimate used while that log is empty
+_COST_LOGS = {
+    "ingesta_log.csv": ("costo_total_usd", 0.05),
+    "busqueda_log.csv": ("costo_total_usd", 0.0002),
+    "generacion_log.csv": ("costo_usd", 0.003),
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=6)
+def _cost_stats(filename: str, key) -> tuple:
+    """
+    (sum, mean) of a log's cost column, or None without data. The mean is
+    derived from the sum, so the column is reduced once; ``key`` is the
+    log's _log_key() and only serves to invalidate the cache.
+    """
+    cost_col = _COST_LOGS[filename][0]
+    df = load_log(filename)
+    if df.empty or cost_col not in df.columns:
+        return None
+    costs = df[cost_col]
+    total, count = costs.sum(), costs.count()
+    return total, (total / count if count else float("nan"))
+
+
+def _avg_unit_costs() -> tuple:
+    """Mean cost per ingested doc / search / generated piece, falling back to default estimates."""
+    means = []
+    for filename, (_, default) in _COST_LOGS.items():
+        stats = _cost_stats(filename, _log_key(filename))
+        means.append(stats[1] if stats else default)
+    return tuple(means)
+
+
+def _project_grid(docs, queries, pieces, unit_costs) -> np.ndarray:
+    """Monthly total for every (docs, queries) pair at a fixed pieces/month, via broadcasting."""
+    ci, cs, cg = unit_costs
+    return docs[:, None] * ci + queries[None, :] * cs + pieces * cg
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_document_summary() -> tuple:
+    """
+    (documents DataFrame, lower-cased "title<US>source" Series) for the KB tab.
+    The search column is built here so filter keystrokes only run the scan.
+    """
+    df_docs = pd.DataFrame(run_async(get_document_summary()))
+    if df_docs.empty:
+        return df_docs, pd.Series(dtype=str)
+    haystack = (df_docs["title"].fillna("") + "\x1f" + df_docs["source"].fillna("")).str.lower()
+    return df_docs, haystack
+
+
+# Heavy or tab-specific modules are imported once, on first use, through these
+# cached factories instead of by import statements inside the tab bodies.
+@st.cache_resource(show_spinner=False)
+def _settings():
+    from agent.config import settings
+    return settings
+
+
+@st.cache_resource(show_spinner=False)
+def _ingest_fn():
+    from ingestion.ingest import ingest_files
+    return ingest_files
+
+
+@st.cache_resource(show_spinner=False)
+def _content_generator():
+    return get_content_generator()
+
+
+@st.cache_resource(show_spinner=False)
+def _generation_service():
+    from services.generation_service import GenerationService
+    return GenerationService()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_budget() -> dict:
+    """get_budget_summary() memoised briefly so both budget panels share one read."""
+    from poc.budget_guard import get_budget_summary
+    return get_budget_summary()
+
+
+# Uploads with these extensions are saved byte-for-byte; the rest are normalised to UTF-8
+_BINARY_UPLOAD_EXTS = (".pdf",)
+
+# Bars drawn per Analytics log chart (slowest first); the tables keep every row
+_CHART_TOP_N = 20
+
+# Search type label (either language, lower-cased) -> tool; anything else is hybrid
+_SEARCH_DISPATCH = {
+    "vector": vector_search_tool,
+    "graph": graph_search_tool,
+    "grafo": graph_search_tool,
+}
+
+
 # ---------------------------------------------------------------------------
 # Sidebar
 # ---------------------------------------------------------------------------
@@ -106,19 +224,31 @@ with st.sidebar:
     st.info(t("sidebar.provider", lang, p=provider))
     st.divider()
 
-    st.subheader(t("sidebar.actions", lang))
-    if st.button(t("sidebar.clear_btn", lang), type="primary"):
+    st.subheader(t_plain("sidebar.actions", lang))
+    # Toasts queued before an st.rerun() are shown on the following run
+    if "sidebar_toast" in st.session_state:
+        st.toast(st.session_state.pop("sidebar_toast"))
+
+    # A finished clear unticks the confirmation so the next click asks again
+    if st.session_state.pop("sidebar_reset_confirm", False):
+        st.session_state["sidebar_confirm"] = False
+    _confirmed = st.checkbox(t_plain("sidebar.confirm", lang), key="sidebar_confirm")
+    if st.button(t_plain("sidebar.clear_btn", lang), type="primary", disabled=not _confirmed):
+        # The DB wipe runs on the background loop while the log files are truncated here
+        _db_cleared = asyncio.run_coroutine_threadsafe(DatabasePool.clear_database(), _background_loop())
         clear_all_logs()
-        run_async(DatabasePool.clear_database())
-        st.success(t("sidebar.clear_ok", lang))
-        time.sleep(0.8)
+        _db_cleared.result()
+        st.cache_data.clear()
+        st.session_state["sidebar_toast"] = t_plain("sidebar.clear_ok", lang)
+        st.session_state["sidebar_reset_confirm"] = True
         st.rerun()
 
-    if st.button(t("sidebar.hydrate_btn", lang), help=t("sidebar.hydrate_help", lang)):
-        with st.spinner(t("sidebar.hydrate_spinner", lang)):
+    if st.button(t_plain("sidebar.hydrate_btn", lang), help=t_plain("sidebar.hydrate_help", lang), disabled=not _confirmed):
+        with st.spinner(t_plain("sidebar.hydrate_spinner", lang)):
             try:
                 run_async(hydrate_graph(reset_flags=True))
-                st.success(t("sidebar.hydrate_ok", lang))
+                st.cache_data.clear()
+                st.success(t_plain("sidebar.hydrate_ok", lang))
             except Exception as e:
                 st.error(t("sidebar.hydrate_err", lang, e=e))
 
@@ -127,148 +257,156 @@ with st.sidebar:
 # App title
 # ---------------------------------------------------------------------------
 
-st.title(t("app.title", lang))
+st.title(t_plain("app.title", lang))
 
 # ---------------------------------------------------------------------------
 # Tabs
 # ---------------------------------------------------------------------------
 
+tab_names = tab_labels(lang, "tab")
 tab_ingest, tab_kb, tab_search, tab_gen, tab_analytics, tab_projections, tab_neo4j = st.tabs([
-    t("tab.ingestion", lang),
-    t("tab.kb", lang),
-    t("tab.search", lang),
-    t("tab.gen", lang),
-    t("tab.analytics", lang),
-    t("tab.projections", lang),
-    t("tab.neo4j", lang),
+    tab_names["ingestion"],
+    tab_names["kb"],
+    tab_names["search"],
+    tab_names["gen"],
+    tab_names["analytics"],
+    tab_names["projections"],
+    tab_names["neo4j"],
 ])
 
 
 # ── TAB 1: INGESTION ────────────────────────────────────────────────────────
 with tab_ingest:
-    st.header(t("ingest.header", lang))
+    L = tab_labels(lang, "ingest")
+    st.header(L["header"])
 
     skip_graphiti_global = st.checkbox(
-        t("ingest.skip_graphiti", lang),
+        L["skip_graphiti"],
         value=True,
-        help=t("ingest.skip_graphiti_help", lang),
+        help=L["skip_graphiti_help"],
     )
 
     # ── Modo 1: Subir archivos ───────────────────────────────────────────────
-    st.subheader(t("ingest.upload_header", lang))
+    st.subheader(L["upload_header"])
     uploaded_files = st.file_uploader(
-        t("ingest.upload_label", lang),
+        L["upload_label"],
         type=["txt", "md", "csv", "pdf"],
         accept_multiple_files=True,
-        help=t("ingest.upload_help", lang),
+        help=L["upload_help"],
     )
 
     if uploaded_files:
         st.info(t("ingest.upload_selected", lang, n=len(uploaded_files),
                    names=", ".join(f.name for f in uploaded_files)))
 
-        if st.button(t("ingest.upload_btn", lang), type="primary"):
+        if st.button(L["upload_btn"], type="primary"):
             save_dir = "documents_to_index"
             os.makedirs(save_dir, exist_ok=True)
             saved_paths = []
 
-            with st.status(t("ingest.upload_processing", lang), expanded=True) as upload_status:
-                st.write(t("ingest.upload_saving", lang))
+            with st.status(L["upload_processing"], expanded=True) as upload_status:
+                st.write(L["upload_saving"])
                 for uf in uploaded_files:
                     dest = os.path.join(save_dir, uf.name)
                     try:
-                        raw = uf.read()
-                        try:
-                            text = raw.decode("utf-8")
-                        except UnicodeDecodeError:
-                            text = raw.decode("latin-1", errors="replace")
-                        with open(dest, "w", encoding="utf-8") as fh:
-                            fh.write(text)
+                        if uf.name.lower().endswith(_BINARY_UPLOAD_EXTS):
+                            # Write the upload buffer verbatim (zero-copy view, no transcoding)
+                            with open(dest, "wb") as fh:
+                                fh.write(uf.getbuffer())
+                        else:
+                            raw = uf.getbuffer()
+                            try:
+                                str(raw, "utf-8")  # validate only; valid UTF-8 is written as-is
+                            except UnicodeDecodeError:
+                                with open(dest, "w", encoding="utf-8") as fh:
+                                    fh.write(str(raw, "latin-1", errors="replace"))
+                            else:
+                                with open(dest, "wb") as fh:
+                                    fh.write(raw)
                         saved_paths.append(dest)
                         st.write(t("ingest.upload_saved_ok", lang, name=uf.name))
                     except Exception as e:
                         st.write(t("ingest.upload_saved_err", lang, name=uf.name, e=e))
 
                 if not saved_paths:
-                    upload_status.update(label=t("ingest.upload_no_valid", lang), state="error")
+                    upload_status.update(label=L["upload_no_valid"], state="error")
                 else:
                     st.write(t("ingest.upload_indexing", lang, n=len(saved_paths)))
                     try:
-                        from ingestion.ingest import ingest_files
-                        run_async(ingest_files(saved_paths, skip_graphiti=skip_graphiti_global))
+                        run_async(_ingest_fn()(saved_paths, skip_graphiti=skip_graphiti_global))
+                        load_document_summary.clear()
                         upload_status.update(
                             label=t("ingest.upload_done", lang, n=len(saved_paths)),
                             state="complete", expanded=False,
                         )
-                        st.success(t("ingest.upload_success", lang))
+                        st.success(L["upload_success"])
                     except Exception as exc:
-                        upload_status.update(label=t("ingest.upload_no_valid", lang), state="error")
+                        upload_status.update(label=L["upload_no_valid"], state="error")
                         st.error(t("ingest.upload_ingest_err", lang, e=exc))
 
     st.divider()
 
     # ── Modo 2: Directorio existente ─────────────────────────────────────────
-    st.subheader(t("ingest.dir_header", lang))
+    st.subheader(L["dir_header"])
     col1, col2 = st.columns([3, 1])
     with col1:
-        docs_dir = st.text_input(t("ingest.dir_label", lang), value="documents_to_index")
+        docs_dir = st.text_input(L["dir_label"], value="documents_to_index")
     with col2:
         st.write("")
         st.write("")
 
-    if st.button(t("ingest.dir_btn", lang)):
+    if st.button(L["dir_btn"]):
         if not os.path.exists(docs_dir):
             st.error(t("ingest.dir_not_found", lang, d=docs_dir))
         else:
-            with st.status(t("ingest.dir_spinner", lang), expanded=True) as status:
-                st.write(t("ingest.dir_init", lang))
+            with st.status(L["dir_spinner"], expanded=True) as status:
+                st.write(L["dir_init"])
                 try:
                     run_async(run_ingestion(docs_dir, skip_graphiti=skip_graphiti_global))
-                    status.update(label=t("ingest.dir_done", lang), state="complete", expanded=False)
+                    load_document_summary.clear()
+                    status.update(label=L["dir_done"], state="complete", expanded=False)
                     st.success(t("ingest.dir_success", lang, d=docs_dir))
                 except Exception as exc:
-                    status.update(label=t("ingest.dir_failed", lang), state="error")
+                    status.update(label=L["dir_failed"], state="error")
                     st.error(t("ingest.dir_err", lang, e=exc))
 
 
 # ── TAB 2: KNOWLEDGE BASE ───────────────────────────────────────────────────
 with tab_kb:
-    st.header(t("kb.header", lang))
-    if st.button(t("kb.refresh", lang), key="refresh_kb"):
+    st.header(t_plain("kb.header", lang))
+    if st.button(t_plain("kb.refresh", lang), key="refresh_kb"):
+        load_document_summary.clear()
         st.rerun()
 
     try:
-        docs = run_async(get_document_summary())
-        if not docs:
-            st.info(t("kb.no_docs", lang))
+        df_docs, haystack = load_document_summary()
+        if df_docs.empty:
+            st.info(t_plain("kb.no_docs", lang))
         else:
-            df_docs = pd.DataFrame(docs)
             total_docs = len(df_docs)
             total_chunks = df_docs["chunk_count"].sum() if "chunk_count" in df_docs.columns else 0
 
             c1, c2 = st.columns(2)
-            c1.metric(t("kb.total_docs", lang), total_docs)
-            c2.metric(t("kb.total_chunks", lang), total_chunks)
+            c1.metric(t_plain("kb.total_docs", lang), total_docs)
+            c2.metric(t_plain("kb.total_chunks", lang), total_chunks)
 
             st.divider()
 
-            filter_txt = st.text_input(t("kb.filter", lang), "", key="kb_filter")
+            filter_txt = st.text_input(t_plain("kb.filter", lang), "", key="kb_filter")
             if filter_txt:
-                df_docs = df_docs[
-                    df_docs["title"].str.contains(filter_txt, case=False, na=False) |
-                    df_docs["source"].str.contains(filter_txt, case=False, na=False)
-                ]
+                # One plain-substring pass over the cached "title<US>source" column
+                df_docs = df_docs[haystack.str.contains(filter_txt.lower(), regex=False)]
 
             st.dataframe(
                 df_docs,
                 column_config={
-                    "title": st.column_config.TextColumn(t("kb.col_title", lang)),
-                    "source": st.column_config.TextColumn(t("kb.col_path", lang)),
-                    "chunk_count": st.column_config.NumberColumn(t("kb.col_chunks", lang)),
+                    "title": st.column_config.TextColumn(t_plain("kb.col_title", lang)),
+                    "source": st.column_config.TextColumn(t_plain("kb.col_path", lang)),
+                    "chunk_count": st.column_config.NumberColumn(t_plain("kb.col_chunks", lang)),
                     "total_tokens": st.column_config.NumberColumn("Tokens"),
                     "graph_ingested": st.column_config.CheckboxColumn("En Grafo"),
                     "has_graphiti_node": st.column_config.CheckboxColumn("ID Graphiti"),
-                    "created_at": st.column_config.DatetimeColumn(t("kb.col_ingested", lang), format="D MMM YYYY, h:mm a"),
+                    "created_at": st.column_config.DatetimeColumn(t_plain("kb.col_ingested", lang), format="D MMM YYYY, h:mm a"),
                 },
                 width="stretch",
                 hide_index=True,
@@ -278,51 +416,69 @@ with tab_kb:
 
 
 # ── TAB 3: SEARCH ───────────────────────────────────────────────────────────
+def _serialize_results(results) -> list:
+    """(raw data JSON, metadata JSON or None) per result, serialized once per search."""
+    return [
+        (
+            json.dumps(r.__dict__, indent=2, sort_keys=True, default=str),
+            json.dumps(r.metadata, indent=2, sort_keys=True, default=str) if r.metadata else None,
+        )
+        for r in results
+    ]
+
+
+@st.fragment
+def _render_search_results(results, payloads):
+    """Results list; toggling debug mode reruns only this fragment, not the search."""
+    st.subheader(t("search.results", lang, n=len(results)))
+
+    debug_mode = st.checkbox(t_plain("search.debug", lang), value=False)
+
+    for i, (r, (raw_json, meta_json)) in enumerate(zip(results, payloads), 1):
+        with st.expander(f"#{i} — {t_plain('search.score', lang)} {r.score:.3f} [{r.source}]"):
+            st.markdown(r.content)
+            if debug_mode:
+                st.caption(t_plain("search.raw_data", lang))
+                st.code(raw_json, language="json")
+            elif meta_json:
+                st.caption(t_plain("search.metadata", lang))
+                st.code(meta_json, language="json")
+
+
 with tab_search:
-    st.header(t("search.header", lang))
+    st.header(t_plain("search.header", lang))
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        query = st.text_area(t("search.query_label", lang), t("search.query_default", lang))
+        query = st.text_area(t_plain("search.query_label", lang), t_plain("search.query_default", lang))
     with col2:
-        _search_types = t("search.types", lang)
-        search_type = st.radio(t("search.type_label", lang), _search_types, index=2)
+        _search_types = t_plain("search.types", lang)
+        search_type = st.radio(t_plain("search.type_label", lang), _search_types, index=2)
+
+    # A click always re-runs the search; other reruns reuse the last (query, type) results
+    _search_key = (query, search_type)
+    _last_search = st.session_state.get("last_search")
 
-    if st.button(t("search.btn", lang)):
+    if st.button(t_plain("search.btn", lang)):
         with st.spinner(t("search.spinner", lang, t=search_type)):
             try:
-                # Map display label back to function (works for both languages)
-                _type_lower = search_type.lower()
-                if _type_lower in ("vector",):
-                    results = run_async(vector_search_tool(query))
-                elif _type_lower in ("graph", "grafo"):
-                    results = run_async(graph_search_tool(query))
-                else:
-                    results = run_async(hybrid_search_tool(query))
-
-                st.subheader(t("search.results", lang, n=len(results)))
-
-                debug_mode = st.checkbox(t("search.debug", lang), value=False)
-
-                for i, r in enumerate(results, 1):
-                    with st.expander(f"#{i} — {t('search.score', lang)} {r.score:.3f} [{r.source}]"):
-                        st.markdown(r.content)
-                        if debug_mode:
-                            st.caption(t("search.raw_data", lang))
-                            st.json(r.__dict__)
-                        elif r.metadata:
-                            st.caption(t("search.metadata", lang))
-                            st.json(r.metadata)
+                tool = _SEARCH_DISPATCH.get(search_type.lower(), hybrid_search_tool)
+                _results = run_async(tool(query))
+                _last_search = (_search_key, _results, _serialize_results(_results))
+                st.session_state["last_search"] = _last_search
             except Exception as exc:
                 st.error(t("search.error", lang, e=exc))
 
+    if _last_search is not None and _last_search[0] == _search_key:
+        _render_search_results(*_last_search[1:])
+
 
 # ── TAB 4: GENERATION ───────────────────────────────────────────────────────
 with tab_gen:
-    st.header(t("gen.header", lang))
+    st.header(t_plain("gen.header", lang))
 
-    _templates = t("gen.templates", lang)
-    template_type = st.selectbox(t("gen.template_label", lang), _templates)
+    _templates = t_plain("gen.templates", lang)
+    template_type = st.selectbox(t_plain("gen.template_label", lang), _templates)
 
     prompt = system_prompt = ""
     formato = "text"
@@ -331,10 +487,10 @@ with tab_gen:
     if template_type in (_templates[0],):  # Cold Email / Email Frío
         col1, col2 = st.columns(2)
         with col1:
-            topic = st.text_input(t("gen.topic", lang), t("gen.email_topic_default", lang))
-            objective = st.text_input(t("gen.objective", lang), t("gen.email_objective_default", lang))
+            topic = st.text_input(t_plain("gen.topic", lang), t_plain("gen.email_topic_default", lang))
+            objective = st.text_input(t_plain("gen.objective", lang), t_plain("gen.email_objective_default", lang))
         with col2:
-            context = st.text_area(t("gen.context", lang), t("gen.email_context_default", lang))
+            context = st.text_area(t_plain("gen.context", lang), t_plain("gen.email_context_default", lang))
         system_prompt = email.SYSTEM_PROMPT
         prompt = email.PROMPT_TEMPLATE.format(topic=topic, context=context, objective=objective)
         formato = "email"
@@ -342,10 +498,10 @@ with tab_gen:
     elif template_type in (_templates[1],):  # Startup Story / Historia de Startup
         col1, col2 = st.columns(2)
         with col1:
-            topic = st.text_input(t("gen.topic", lang), t("gen.historia_topic_default", lang))
-            tone = st.text_input(t("gen.tone", lang), t("gen.historia_tone_default", lang))
+            topic = st.text_input(t_plain("gen.topic", lang), t_plain("gen.historia_topic_default", lang))
+            tone = st.text_input(t_plain("gen.tone", lang), t_plain("gen.historia_tone_default", lang))
         with col2:
-            context = st.text_area(t("gen.context", lang), t("gen.historia_context_default", lang), height=100)
+            context = st.text_area(t_plain("gen.context", lang), t_plain("gen.historia_context_default", lang), height=100)
         system_prompt = historia.SYSTEM_PROMPT
         prompt = historia.PROMPT_TEMPLATE.format(topic=topic, context=context, tone=tone)
         formato = "historia"
@@ -353,28 +509,28 @@ with tab_gen:
     elif template_type in (_templates[2],):  # Instagram Reel / Reel de Instagram
         col1, col2 = st.columns(2)
         with col1:
-            topic = st.text_input(t("gen.topic", lang), t("gen.reel_topic_default", lang))
-            cta = st.text_input(t("gen.cta", lang), t("gen.reel_cta_default", lang))
+            topic = st.text_input(t_plain("gen.topic", lang), t_plain("gen.reel_topic_default", lang))
+            cta = st.text_input(t_plain("gen.cta", lang), t_plain("gen.reel_cta_default", lang))
         with col2:
-            context = st.text_input(t("gen.context", lang), t("gen.reel_context_default", lang))
+            context = st.text_input(t_plain("gen.context", lang), t_plain("gen.reel_context_default", lang))
         system_prompt = reel_cta.SYSTEM_PROMPT
         prompt = reel_cta.PROMPT_TEMPLATE.format(topic=topic, context=context, cta=cta)
         formato = "reel_cta"
 
     elif template_type in (_templates[3],):  # Custom / Personalizado
-        topic = st.text_input(t("gen.topic", lang), t("gen.custom_topic_default", lang))
-        system_prompt = st.text_area(t("gen.system_prompt", lang), t("gen.custom_system_default", lang))
-        prompt = st.text_area(t("gen.prompt", lang), t("gen.custom_prompt_default", lang), height=150)
+        topic = st.text_input(t_plain("gen.topic", lang), t_plain("gen.custom_topic_default", lang))
+        system_prompt = st.text_area(t_plain("gen.system_prompt", lang), t_plain("gen.custom_system_default", lang))
+        prompt = st.text_area(t_plain("gen.prompt", lang), t_plain("gen.custom_prompt_default", lang), height=150)
         formato = "custom"
 
-    if st.button(t("gen.btn", lang)):
-        with st.spinner(t("gen.spinner", lang)):
+    if st.button(t_plain("gen.btn", lang)):
+        with st.spinner(t_plain("gen.spinner", lang)):
             try:
-                generator = get_content_generator()
+                generator = _content_generator()
                 content = run_async(
                     generator.generate(prompt, system_prompt, formato=formato, tema=topic)
                 )
-                st.subheader(t("gen.result_header", lang))
+                st.subheader(t_plain("gen.result_header", lang))
                 st.markdown(content)
                 st.divider()
                 st.caption(t("gen.generated_with", lang, p=provider))
@@ -383,52 +539,51 @@ with tab_gen:
 
     # ── Sección: Agentes Estructurados ────────────────────────────────────────
     st.divider()
-    st.subheader(t("gen.agent_header", lang))
-    st.caption(t("gen.agent_caption", lang))
+    st.subheader(t_plain("gen.agent_header", lang))
+    st.caption(t_plain("gen.agent_caption", lang))
 
     col_fmt, col_topic = st.columns(2)
     with col_fmt:
         new_formato = st.selectbox(
-            t("gen.agent_format", lang),
+            t_plain("gen.agent_format", lang),
             ["reel_cta", "historia", "email", "reel_lead_magnet", "ads"],
             key="new_gen_formato",
         )
     with col_topic:
-        new_topic = st.text_input(t("gen.agent_topic", lang), t("gen.agent_topic_default", lang), key="new_gen_topic")
+        new_topic = st.text_input(t_plain("gen.agent_topic", lang), t_plain("gen.agent_topic_default", lang), key="new_gen_topic")
 
-    new_context = st.text_area(t("gen.agent_context", lang), "", height=100, key="new_gen_context")
+    new_context = st.text_area(t_plain("gen.agent_context", lang), "", height=100, key="new_gen_context")
 
     extra_params = {}
     if new_formato == "reel_cta":
-        extra_params["cta"] = st.text_input(t("gen.cta", lang), t("gen.reel_cta_agent_default", lang), key="reel_cta_cta")
+        extra_params["cta"] = st.text_input(t_plain("gen.cta", lang), t_plain("gen.reel_cta_agent_default", lang), key="reel_cta_cta")
     elif new_formato == "historia":
-        extra_params["tone"] = st.text_input(t("gen.tone", lang), t("gen.historia_tone_agent_default", lang), key="historia_tone")
-        _historia_opts = t("gen.historia_tipo_options", lang)
-        extra_params["tipo"] = st.selectbox(t("gen.historia_tipo_label", lang), _historia_opts, key="historia_tipo")
+        extra_params["tone"] = st.text_input(t_plain("gen.tone", lang), t_plain("gen.historia_tone_agent_default", lang), key="historia_tone")
+        _historia_opts = t_plain("gen.historia_tipo_options", lang)
+        extra_params["tipo"] = st.selectbox(t_plain("gen.historia_tipo_label", lang), _historia_opts, key="historia_tipo")
     elif new_formato == "email":
-        extra_params["objective"] = st.text_input(t("gen.objective", lang), t("gen.email_objective_agent_default", lang), key="email_obj")
+        extra_params["objective"] = st.text_input(t_plain("gen.objective", lang), t_plain("gen.email_objective_agent_default", lang), key="email_obj")
     elif new_formato == "reel_lead_magnet":
-        extra_params["lead_magnet"] = st.text_input(t("gen.lead_magnet_label", lang), t("gen.lead_magnet_default", lang), key="rlm_lm")
+        extra_params["lead_magnet"] = st.text_input(t_plain("gen.lead_magnet_label", lang), t_plain("gen.lead_magnet_default", lang), key="rlm_lm")
     elif new_formato == "ads":
-        _ads_opts = t("gen.ads_tipo_options", lang)
-        extra_params["tipo"] = st.selectbox(t("gen.ads_tipo_label", lang), _ads_opts, key="ads_tipo")
+        _ads_opts = t_plain("gen.ads_tipo_options", lang)
+        extra_params["tipo"] = st.selectbox(t_plain("gen.ads_tipo_label", lang), _ads_opts, key="ads_tipo")
 
-    if st.button(t("gen.agent_btn", lang)):
+    if st.button(t_plain("gen.agent_btn", lang)):
         with st.spinner(t("gen.agent_spinner", lang, f=new_formato)):
             try:
-                from services.generation_service import GenerationService
-                from poc.budget_guard import get_budget_summary
-
                 if not new_context:
                     results = run_async(hybrid_search_tool(new_topic, limit=3))
-                    context_for_gen = "\n\n---\n\n".join(r.content for r in results) if results else t("gen.no_context_fallback", lang)
+                    context_for_gen = "\n\n---\n\n".join(r.content for r in results) if results else t_plain("gen.no_context_fallback", lang)
                 else:
                     context_for_gen = new_context
 
-                service = GenerationService()
+                service = _generation_service()
                 output = run_async(service.generate(new_formato, topic=new_topic, context=context_for_gen, **extra_params))
 
-                budget = get_budget_summary()
+                # The run just recorded new spend, so drop the memoised summary first
+                _cached_budget.clear()
+                budget = _cached_budget()
                 if budget["status"] == "critical":
                     st.warning(t("gen.agent_budget_critical", lang, pct=budget["percentage"], m=budget["active_model"]))
                 elif budget["status"] == "warning":
@@ -449,8 +604,8 @@ with tab_gen:
 
 # ── TAB 5: ANALYTICS ────────────────────────────────────────────────────────
 with tab_analytics:
-    st.header(t("analytics.header", lang))
-    if st.button(t("analytics.refresh", lang)):
+    st.header(t_plain("analytics.header", lang))
+    if st.button(t_plain("analytics.refresh", lang)):
         st.rerun()
 
     df_ingest = load_log("ingesta_log.csv")
@@ -458,76 +613,69 @@ with tab_analytics:
     df_gen = load_log("generacion_log.csv")
 
     total_cost = 0.0
-    if not df_ingest.empty and "costo_total_usd" in df_ingest.columns:
-        total_cost += df_ingest["costo_total_usd"].sum()
-    if not df_gen.empty and "costo_usd" in df_gen.columns:
-        total_cost += df_gen["costo_usd"].sum()
+    for _filename in ("ingesta_log.csv", "generacion_log.csv"):
+        _stats = _cost_stats(_filename, _log_key(_filename))
+        if _stats:
+            total_cost += _stats[0]
 
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric(t("analytics.total_cost", lang), f"${total_cost:.4f}")
-    c2.metric(t("analytics.files_ingested", lang), len(df_ingest) if not df_ingest.empty else 0)
-    c3.metric(t("analytics.searches", lang), len(df_search) if not df_search.empty else 0)
-    c4.metric(t("analytics.generated", lang), len(df_gen) if not df_gen.empty else 0)
+    c1.metric(t_plain("analytics.total_cost", lang), f"${total_cost:.4f}")
+    c2.metric(t_plain("analytics.files_ingested", lang), len(df_ingest) if not df_ingest.empty else 0)
+    c3.metric(t_plain("analytics.searches", lang), len(df_search) if not df_search.empty else 0)
+    c4.metric(t_plain("analytics.generated", lang), len(df_gen) if not df_gen.empty else 0)
     st.divider()
 
-    st.subheader(t("analytics.cost_evolution", lang))
-    cost_data = []
-    _label_time = t("analytics.axis_time", lang)
-    _label_cost = t("analytics.axis_cost", lang)
-    _label_type = t("analytics.axis_type", lang)
-
-    if not df_ingest.empty and "timestamp" in df_ingest.columns:
-        for _, r in df_ingest.iterrows():
-            cost_data.append({
-                _label_time: r["timestamp"],
-                _label_cost: r.get("costo_total_usd", 0),
-                _label_type: t("tab.ingestion", lang)
-            })
-    if not df_search.empty and "timestamp" in df_search.columns:
-        for _, r in df_search.iterrows():
-            cost_data.append({
-                _label_time: r["timestamp"],
-                _label_cost: r.get("costo_total_usd", 0),
-                _label_type: t("tab.search", lang)
-            })
-    if not df_gen.empty and "timestamp" in df_gen.columns:
-        for _, r in df_gen.iterrows():
-            cost_data.append({
-                _label_time: r["timestamp"],
-                _label_cost: r.get("costo_usd", 0),
-                _label_type: t("tab.gen", lang)
-            })
-
-    if cost_data:
-        df_cost = pd.DataFrame(cost_data)
-        df_cost[_label_time] = pd.to_datetime(df_cost[_label_time], unit="s")
+    st.subheader(t_plain("analytics.cost_evolution", lang))
+    _label_time = t_plain("analytics.axis_time", lang)
+    _label_cost = t_plain("analytics.axis_cost", lang)
+    _label_type = t_plain("analytics.axis_type", lang)
+
+    cost_parts = []
+    for df_log, cost_col, type_label in (
+        (df_ingest, "costo_total_usd", tab_names["ingestion"]),
+        (df_search, "costo_total_usd", tab_names["search"]),
+        (df_gen, "costo_usd", tab_names["gen"]),
+    ):
+        if not df_log.empty and "timestamp" in df_log.columns:
+            cost_parts.append(pd.DataFrame({
+                _label_time: df_log["timestamp"].to_numpy(),
+                _label_cost: df_log[cost_col].to_numpy() if cost_col in df_log.columns else 0,
+                _label_type: type_label,
+            }))
+
+    if cost_parts:
+        df_cost = pd.concat(cost_parts, ignore_index=True)
         st.scatter_chart(df_cost, x=_label_time, y=_label_cost, color=_label_type)
     else:
-        st.info(t("analytics.no_cost_data", lang))
+        st.info(t_plain("analytics.no_cost_data", lang))
 
     st.divider()
 
     log1, log2, log3 = st.tabs([
-        t("analytics.log_ingestion", lang),
-        t("analytics.log_search", lang),
-        t("analytics.log_gen", lang),
+        t_plain("analytics.log_ingestion", lang),
+        t_plain("analytics.log_search", lang),
+        t_plain("analytics.log_gen", lang),
     ])
 
     with log1:
         if not df_ingest.empty:
             st.dataframe(df_ingest, width="stretch")
             if "tiempo_seg" in df_ingest.columns and "nombre_archivo" in df_ingest.columns:
-                st.bar_chart(df_ingest.set_index("nombre_archivo")["tiempo_seg"])
+                st.bar_chart(df_ingest.nlargest(_CHART_TOP_N, "tiempo_seg"), x="nombre_archivo", y="tiempo_seg")
         else:
-            st.info(t("analytics.no_ingest_logs", lang))
+            st.info(t_plain("analytics.no_ingest_logs", lang))
 
     with log2:
         if not df_search.empty:
             st.dataframe(df_search, width="stretch")
             if "latencia_ms" in df_search.columns and "tipo_busqueda" in df_search.columns:
-                st.bar_chart(df_search.groupby("tipo_busqueda")["latencia_ms"].mean())
+                st.bar_chart(
+                    df_search.groupby("tipo_busqueda", as_index=False)["latencia_ms"].mean()
+                    .nlargest(_CHART_TOP_N, "latencia_ms"),
+                    x="tipo_busqueda", y="latencia_ms",
+                )
         else:
-            st.info(t("analytics.no_search_logs", lang))
+            st.info(t_plain("analytics.no_search_logs", lang))
 
     with log3:
         if not df_gen.empty:
@@ -535,20 +683,19 @@ with tab_analytics:
             if "tokens_out" in df_gen.columns and "tiempo_seg" in df_gen.columns:
                 st.scatter_chart(df_gen, x="tokens_out", y="tiempo_seg", color="modelo")
         else:
-            st.info(t("analytics.no_gen_logs", lang))
+            st.info(t_plain("analytics.no_gen_logs", lang))
 
     # ── Budget Panel ─────────────────────────────────────────────────────────
     st.divider()
-    st.subheader(t("analytics.budget_header", lang))
+    st.subheader(t_plain("analytics.budget_header", lang))
     try:
-        from poc.budget_guard import get_budget_summary
-        budget = get_budget_summary()
+        budget = _cached_budget()
 
         col_b1, col_b2, col_b3, col_b4 = st.columns(4)
-        col_b1.metric(t("analytics.budget_spent", lang), f"${budget['spent_usd']:.2f}")
-        col_b2.metric(t("analytics.budget_total", lang), f"${budget['budget_usd']:.2f}")
-        col_b3.metric(t("analytics.budget_pct", lang), f"{budget['percentage']}%")
-        col_b4.metric(t("analytics.budget_projection", lang), f"${budget['projected_monthly']:.2f}")
+        col_b1.metric(t_plain("analytics.budget_spent", lang), f"${budget['spent_usd']:.2f}")
+        col_b2.metric(t_plain("analytics.budget_total", lang), f"${budget['budget_usd']:.2f}")
+        col_b3.metric(t_plain("analytics.budget_pct", lang), f"{budget['percentage']}%")
+        col_b4.metric(t_plain("analytics.budget_projection", lang), f"${budget['projected_monthly']:.2f}")
 
         if budget["fallback_active"]:
             st.error(t("analytics.budget_fallback", lang, m=budget["active_model"]))
@@ -562,32 +709,18 @@ with tab_analytics:
 
 # ── TAB 6: PROYECCIONES ─────────────────────────────────────────────────────
 with tab_projections:
-    st.header(t("proj.header", lang))
-    st.caption(t("proj.caption", lang))
+    st.header(t_plain("proj.header", lang))
+    st.caption(t_plain("proj.caption", lang))
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        docs_per_month = st.number_input(t("proj.docs_month", lang), min_value=1, value=250, step=10)
+        docs_per_month = st.number_input(t_plain("proj.docs_month", lang), min_value=1, value=250, step=10)
     with col2:
-        queries_per_month = st.number_input(t("proj.queries_month", lang), min_value=0, value=5000, step=100)
+        queries_per_month = st.number_input(t_plain("proj.queries_month", lang), min_value=0, value=5000, step=100)
     with col3:
-        pieces_per_month = st.number_input(t("proj.pieces_month", lang), min_value=0, value=200, step=10)
+        pieces_per_month = st.number_input(t_plain("proj.pieces_month", lang), min_value=0, value=200, step=10)
 
-    avg_ingest_cost = (
-        df_ingest["costo_total_usd"].mean()
-        if not df_ingest.empty and "costo_total_usd" in df_ingest.columns
-        else 0.05
-    )
-    avg_search_cost = (
-        df_search["costo_total_usd"].mean()
-        if not df_search.empty and "costo_total_usd" in df_search.columns
-        else 0.0002
-    )
-    avg_gen_cost = (
-        df_gen["costo_usd"].mean()
-        if not df_gen.empty and "costo_usd" in df_gen.columns
-        else 0.003
-    )
+    avg_ingest_cost, avg_search_cost, avg_gen_cost = _avg_unit_costs()
 
     monthly_ingest = docs_per_month * avg_ingest_cost
     monthly_search = queries_per_month * avg_search_cost
@@ -597,23 +730,24 @@ with tab_projections:
 
     st.divider()
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric(t("proj.ingest_month", lang), f"${monthly_ingest:.2f}")
-    c2.metric(t("proj.search_month", lang), f"${monthly_search:.2f}")
-    c3.metric(t("proj.gen_month", lang), f"${monthly_gen:.2f}")
-    c4.metric(t("proj.total_month", lang), f"${monthly_total:.2f}")
+    c1.metric(t_plain("proj.ingest_month", lang), f"${monthly_ingest:.2f}")
+    c2.metric(t_plain("proj.search_month", lang), f"${monthly_search:.2f}")
+    c3.metric(t_plain("proj.gen_month", lang), f"${monthly_gen:.2f}")
+    c4.metric(t_plain("proj.total_month", lang), f"${monthly_total:.2f}")
 
-    st.metric(t("proj.annual", lang), f"${annual_total:.2f}")
+    st.metric(t_plain("proj.annual", lang), f"${annual_total:.2f}")
 
     st.divider()
     if monthly_total < 100:
-        st.success(t("proj.go", lang))
+        st.success(t_plain("proj.go", lang))
     elif monthly_total < 200:
-        st.warning(t("proj.optimize", lang))
+        st.warning(t_plain("proj.optimize", lang))
     else:
-        st.error(t("proj.stop", lang))
+        st.error(t_plain("proj.stop", lang))
 
-    _source = t("proj.source_logs", lang) if not df_ingest.empty else t("proj.source_default", lang)
-    with st.expander(t("proj.unit_costs", lang)):
+    _ingest_stats = _cost_stats("ingesta_log.csv", _log_key("ingesta_log.csv"))
+    _source = t_plain("proj.source_logs", lang) if _ingest_stats else t_plain("proj.source_default", lang)
+    with st.expander(t_plain("proj.unit_costs", lang)):
         st.write({
             "avg_ingest_cost_usd": round(avg_ingest_cost, 6),
             "avg_search_cost_usd": round(avg_search_cost, 6),
@@ -621,6 +755,25 @@ with tab_projections:
             "source": _source,
         })
 
+    with st.expander(t_plain("proj.sensitivity", lang)):
+        st.caption(t("proj.sensitivity_caption", lang, n=pieces_per_month))
+        _docs_axis = np.linspace(0, 2 * docs_per_month, 41)
+        _queries_axis = np.linspace(0, 2 * max(queries_per_month, 1), 41)
+        _grid = _project_grid(
+            _docs_axis, _queries_axis, pieces_per_month,
+            (avg_ingest_cost, avg_search_cost, avg_gen_cost),
+        )
+        _fig = go.Figure(go.Heatmap(
+            z=_grid.T, x=_docs_axis, y=_queries_axis,
+            colorscale="RdYlGn_r", colorbar={"title": "USD"},
+        ))
+        _fig.update_layout(
+            xaxis_title=t_plain("proj.docs_month", lang),
+            yaxis_title=t_plain("proj.queries_month", lang),
+            margin={"l": 0, "r": 0, "t": 10, "b": 0},
+        )
+        st.plotly_chart(_fig, width="stretch")
+
 
 # ── TAB 7: NEO4J GRAPH EXPLORER ─────────────────────────────────────────────
 _NEO4J_LABEL_COLORS = {
@@ -629,201 +782,407 @@ _NEO4J_LABEL_COLORS = {
     "Community": "#AED581",
 }
 _NEO4J_DEFAULT_COLOR = "#B0BEC5"
+_NEO4J_LABEL_TMPL = '<span style="color:{clr};font-weight:600">{label}</span>: {count}'
+_EPISODES_PAGE_SIZE = 50
+# Raised once execute_read gives up on a server that went away after the driver was cached
+_NEO4J_UNAVAILABLE = (neo4j.exceptions.ServiceUnavailable, neo4j.exceptions.SessionExpired)
 
 
+@st.cache_resource(show_spinner=False)
 def _neo4j_driver():
-    from agent.config import settings as _cfg
+    """
+    One driver (and connection pool) shared by every rerun and session.
+    Connectivity is verified once here; a failure raises, so nothing is
+    cached and the next rerun retries.
+    """
+    _cfg = _settings()
     raw_uri = _cfg.NEO4J_URI
     # Force bolt:// scheme — neo4j:// triggers cluster routing which fails on standalone
     uri = raw_uri.replace("neo4j://", "bolt://", 1).replace("neo4j+s://", "bolts://", 1)
     user = _cfg.NEO4J_USER
     pwd = _cfg.NEO4J_PASSWORD
-    return GraphDatabase.driver(uri, auth=neo4j.basic_auth(user, pwd))
-
+    driver = GraphDatabase.driver(
+        uri, auth=neo4j.basic_auth(user, pwd),
+        max_connection_pool_size=_cfg.NEO4J_POOL_SIZE,
+        connection_acquisition_timeout=30,
+    )
+    try:
+        driver.verify_connectivity()
+    except Exception:
+        driver.close()
+        raise
+    atexit.register(driver.close)
+    return driver
+
+
+@st.cache_resource(show_spinner=False)
+def _neo4j_executor() -> ThreadPoolExecutor:
+    """Worker threads for explorer queries that can overlap with the graph fetch."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="neo4j-explorer")
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _render_graph_html(nodes: tuple, edges: tuple, physics_on: bool) -> str:
+    """
+    Build the pyvis network and return its HTML.
+    ``nodes`` holds parallel (ids, labels, titles, colors, sizes) tuples; ``edges``
+    holds (a_id, b_id, title, label) rows. Cached on both so unrelated reruns
+    skip the template render.
+    """
+    net = Network(
+        height="650px", width="100%",
+        bgcolor="#1a1a2e", font_color="white",
+        directed=True, notebook=False,
+    )
+    if physics_on:
+        net.force_atlas_2based(
+            gravity=-50, central_gravity=0.01,
+            spring_length=150, spring_strength=0.08, damping=0.4,
+        )
+    else:
+        net.toggle_physics(False)
 
-def _neo4j_query(driver, cypher, **params):
-    with driver.session(database="neo4j") as s:
-        return s.run(cypher, **params).data()
+    ids, labels, titles, colors, sizes = nodes
+    net.add_nodes(
+        list(ids), label=list(labels), title=list(titles),
+        color=list(colors), size=list(sizes),
+    )
+    # Appended as option dicts: add_edge() re-checks both endpoints against the
+    # node id list (O(nodes) per edge), and the subgraph query already
+    # guarantees every endpoint is in ``ids``.
+    edge_font = {"size": 8, "color": "#aaa"}
+    net.edges.extend(
+        {"from": a_id, "to": b_id, "title": title, "label": label,
+         "color": "#78909C", "arrows": "to", "font": edge_font}
+        for a_id, b_id, title, label in edges
+    )
+    return net.generate_html(notebook=False)
+
+
+def _neo4j_run(tx, cypher, params=None, **kwparams):
+    """Transaction function for execute_read: run the query on ``tx`` and return the rows as dicts."""
+    return tx.run(cypher, params, **kwparams).data()
+
+
+def _neo4j_query(driver, cypher, params=None, **kwparams):
+    """Run a read in its own managed transaction (retried on transient errors)."""
+    with driver.session(database="neo4j", default_access_mode=neo4j.READ_ACCESS) as s:
+        return s.execute_read(_neo4j_run, cypher, params, **kwparams)
+
+
+def _neo4j_df(session, cypher, params=None):
+    """Like _neo4j_run but builds the DataFrame driver-side (no per-row dicts).
+
+    expand=True flattens nodes/relationships into property columns instead of
+    leaving driver objects in the cells.
+    """
+    return session.run(cypher, params).to_df(expand=True)
+
+
+_CYPHER_MAX_ESTIMATED_ROWS = 100_000
+_CYPHER_VAR_LENGTH_RE = re.compile(r"\[[^\]]*\*[^\]]*\]")
+_CYPHER_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
+def _cypher_preflight(session, cypher, params=None) -> list:
+    """
+    Cheap checks before running a user-supplied query.
+    Returns the reasons to hold it back (empty list = safe to run).
+    """
+    problems = []
+    if _CYPHER_VAR_LENGTH_RE.search(cypher) and not _CYPHER_LIMIT_RE.search(cypher):
+        problems.append(t_plain("neo4j.cypher_warn_varlength", lang))
+    if cypher.lstrip().upper().startswith(("EXPLAIN", "PROFILE")):
+        return problems
+    plan = session.run("EXPLAIN " + cypher, params).consume().plan or {}
+    estimated = plan.get("args", {}).get("EstimatedRows", 0)
+    if estimated > _CYPHER_MAX_ESTIMATED_ROWS:
+        problems.append(t("neo4j.cypher_warn_rows", lang, n=int(estimated)))
+    return problems
+
+
+# Every fixed Cypher string the explorer issues, built once at import so each
+# rerun reuses the same objects (and Neo4j sees identical plan-cache keys).
+_NEO4J_QUERIES = {
+    # Count-store snapshot: totals per label and per relationship type, no scan.
+    "graph_counts": "CALL db.stats.retrieve('GRAPH COUNTS') YIELD data RETURN data",
+    # Scanning fallback for graph_counts: same numbers in one round-trip.
+    "graph_stats": (
+        "MATCH (n) RETURN 'nodes' AS kind, '' AS key, count(n) AS count "
+        "UNION ALL "
+        "MATCH (n) UNWIND labels(n) AS label RETURN 'label' AS kind, label AS key, count(*) AS count "
+        "UNION ALL "
+        "MATCH ()-[r]->() RETURN 'rel' AS kind, type(r) AS key, count(*) AS count"
+    ),
+    # Relationship-driven subgraph: up to $rel_lim edges touching the label
+    # filter plus both of their endpoints, topped up to $lim nodes with
+    # unconnected nodes of that label. {label} is "" or ":`Label`" and
+    # {rel_where} the matching edge predicate — labels cannot be parameters,
+    # so both are filled via str.format (literal Cypher braces are doubled).
+    "subgraph": (
+        "CALL {{ "
+        "  MATCH (a)-[r]->(b){rel_where} "
+        "  WITH a, r, b LIMIT $rel_lim "
+        "  RETURN collect({{a: coalesce(a.uuid, a.name, elementId(a)), "
+        "                  b: coalesce(b.uuid, b.name, elementId(b)), "
+        "                  type: type(r), fact: r.fact}}) AS edges, "
+        "         collect(a) + collect(b) AS ends "
+        "}} "
+        "CALL {{ WITH ends UNWIND ends AS e RETURN collect(DISTINCT e) AS linked }} "
+        "CALL {{ "
+        "  WITH linked "
+        "  MATCH (n{label}) WHERE NOT n IN linked "
+        "  WITH n LIMIT $lim "
+        "  RETURN collect(n) AS loose "
+        "}} "
+        "WITH edges, linked + CASE WHEN size(linked) >= $lim THEN [] "
+        "                          ELSE loose[..($lim - size(linked))] END AS ns "
+        "RETURN [n IN ns | {{id: coalesce(n.uuid, n.name, elementId(n)), "
+        "                   name: n.name, label: head(labels(n))}}] AS nodes, edges"
+    ),
+    # The IS NOT NULL predicate lets the planner walk the episodic_created_at
+    # index in order instead of sorting every episode before SKIP/LIMIT.
+    "episodes_page": (
+        "MATCH (e:Episodic) WHERE e.created_at IS NOT NULL "
+        "RETURN e.name AS name, e.created_at AS created, "
+        "e.group_id AS group_id, e.source_description AS source "
+        "ORDER BY e.created_at DESC SKIP $skip LIMIT $size"
+    ),
+}
 
 
-def _neo4j_single(driver, cypher):
-    with driver.session(database="neo4j") as s:
-        return s.run(cypher).single()
+@st.cache_data(ttl=60, show_spinner=False)
+def _neo4j_graph_stats(_driver, uri: str) -> dict:
+    """
+    Node/relationship totals plus per-label and per-type counts.
+    Read from the count store via db.stats.retrieve (O(#labels + #types));
+    falls back to the scanning graph_stats query when the procedure is
+    unavailable or not permitted for this user. ``uri`` only keys the cache
+    (the driver argument itself is not hashed).
+    """
+    stats = {"nodes": 0, "rels": 0, "labels": [], "rel_types": []}
+    try:
+        data = _neo4j_query(_driver, _NEO4J_QUERIES["graph_counts"])[0]["data"]
+    except neo4j.exceptions.Neo4jError:
+        data = None
+
+    if data is not None:
+        for entry in data.get("nodes", []):
+            if "label" in entry:
+                stats["labels"].append({"label": entry["label"], "count": entry["count"]})
+            else:
+                stats["nodes"] = entry["count"]
+        for entry in data.get("relationships", []):
+            # Entries scoped to a start/end label are per-pattern breakdowns; skip them
+            if "startLabel" in entry or "endLabel" in entry:
+                continue
+            if "relationshipType" in entry:
+                stats["rel_types"].append({"type": entry["relationshipType"], "count": entry["count"]})
+    else:
+        for row in _neo4j_query(_driver, _NEO4J_QUERIES["graph_stats"]):
+            if row["kind"] == "nodes":
+                stats["nodes"] = row["count"]
+            elif row["kind"] == "label":
+                stats["labels"].append({"label": row["key"], "count": row["count"]})
+            else:
+                stats["rel_types"].append({"type": row["key"], "count": row["count"]})
+
+    stats["labels"].sort(key=lambda l: l["count"], reverse=True)
+    stats["rel_types"].sort(key=lambda r: r["count"], reverse=True)
+    stats["rels"] = sum(r["count"] for r in stats["rel_types"])
+    return stats
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _neo4j_graph_view(_driver, uri: str, label: str, max_nodes: int, fingerprint: tuple, lang: str) -> tuple:
+    """
+    The graph view's (nodes, edges) tuples in _render_graph_html's layout,
+    built once per fetch. ``fingerprint`` is (n_nodes, n_rels) so the view is
+    refetched when the graph grows; toggling physics never refetches.
+    """
+    if label:
+        quoted = "`" + label.replace("`", "``") + "`"
+        cypher = _NEO4J_QUERIES["subgraph"].format(
+            label=f":{quoted}", rel_where=f" WHERE a:{quoted} OR b:{quoted}")
+    else:
+        cypher = _NEO4J_QUERIES["subgraph"].format(label="", rel_where="")
+    subgraph = _neo4j_query(_driver, cypher, lim=max_nodes, rel_lim=max_nodes * 2)[0]
+
+    unknown = t_plain("neo4j.unknown", lang)
+    label_word = t_plain("neo4j.label", lang)
+    node_labels = [n["label"] or unknown for n in subgraph["nodes"]]
+    nodes = (
+        tuple(n["id"] for n in subgraph["nodes"]),
+        tuple(str(n["name"] or "?")[:30] for n in subgraph["nodes"]),
+        tuple(f"<b>{n['name']}</b><br>{label_word}: {pl}"
+              for n, pl in zip(subgraph["nodes"], node_labels)),
+        tuple(_NEO4J_LABEL_COLORS.get(pl, _NEO4J_DEFAULT_COLOR) for pl in node_labels),
+        tuple(25 if pl == "Episodic" else 18 for pl in node_labels),
+    )
+    edges = tuple(
+        (
+            e["a"], e["b"],
+            f"<b>{e['type']}</b><br>{str(e['fact'])[:200]}" if e["fact"] else f"<b>{e['type']}</b>",
+            e["type"][:20],
+        )
+        for e in subgraph["edges"]
+    )
+    return nodes, edges
 
 
 with tab_neo4j:
-    st.header(t("neo4j.header", lang))
-    from agent.config import settings as _neo4j_cfg
-    _effective_neo4j_uri = _neo4j_cfg.NEO4J_URI.replace("neo4j://", "bolt://", 1)
+    st.header(t_plain("neo4j.header", lang))
+    _effective_neo4j_uri = _settings().NEO4J_URI.replace("neo4j://", "bolt://", 1)
     st.caption(t("neo4j.connected", lang, uri=_effective_neo4j_uri))
 
     try:
         _driver = _neo4j_driver()
-        _driver.verify_connectivity()
     except Exception as exc:
         st.error(t("neo4j.error", lang, e=exc))
         _driver = None
 
+    graph_stats = None
     if _driver:
-        n_nodes = _neo4j_single(_driver, "MATCH (n) RETURN count(n) AS c")["c"]
-        n_rels = _neo4j_single(_driver, "MATCH ()-[r]->() RETURN count(r) AS c")["c"]
-        lbl_data = _neo4j_query(_driver,
-            "MATCH (n) UNWIND labels(n) AS label "
-            "RETURN label, count(*) AS count ORDER BY count DESC")
+        try:
+            graph_stats = _neo4j_graph_stats(_driver, _effective_neo4j_uri)
+        except _NEO4J_UNAVAILABLE as exc:
+            st.error(t("neo4j.error", lang, e=exc))
+
+    if graph_stats:
+        n_nodes = graph_stats["nodes"]
+        n_rels = graph_stats["rels"]
+        lbl_data = graph_stats["labels"]
+        rel_types = graph_stats["rel_types"]
         n_episodes = next((l["count"] for l in lbl_data if l["label"] == "Episodic"), 0)
 
         sc1, sc2, sc3, sc4 = st.columns(4)
-        sc1.metric(t("neo4j.nodes", lang), n_nodes)
-        sc2.metric(t("neo4j.rels", lang), n_rels)
-        sc3.metric(t("neo4j.episodes", lang), n_episodes)
-        sc4.metric(t("neo4j.entity_types", lang), next((l["count"] for l in lbl_data if l["label"] == "Entity"), 0))
+        sc1.metric(t_plain("neo4j.nodes", lang), n_nodes)
+        sc2.metric(t_plain("neo4j.rels", lang), n_rels)
+        sc3.metric(t_plain("neo4j.episodes", lang), n_episodes)
+        sc4.metric(t_plain("neo4j.entity_types", lang), next((l["count"] for l in lbl_data if l["label"] == "Entity"), 0))
 
         neo_tab_graph, neo_tab_episodes, neo_tab_details, neo_tab_query = st.tabs([
-            t("neo4j.subtab_graph", lang),
-            t("neo4j.subtab_episodes", lang),
-            t("neo4j.subtab_details", lang),
-            t("neo4j.subtab_query", lang),
+            t_plain("neo4j.subtab_graph", lang),
+            t_plain("neo4j.subtab_episodes", lang),
+            t_plain("neo4j.subtab_details", lang),
+            t_plain("neo4j.subtab_query", lang),
         ])
 
+        # The episodes page is fetched on a worker thread (own session) while
+        # the graph view below is fetched/rendered on this one.
+        ep_page = 1
+        with neo_tab_episodes:
+            if n_episodes:
+                st.subheader(t("neo4j.episodes_header", lang, n=n_episodes))
+                n_ep_pages = max(1, math.ceil(n_episodes / _EPISODES_PAGE_SIZE))
+                ep_page = st.number_input(
+                    t("neo4j.episodes_page", lang, n=n_ep_pages),
+                    min_value=1, max_value=n_ep_pages, value=1, key="neo_ep_page",
+                )
+        eps_future = _neo4j_executor().submit(
+            _neo4j_query, _driver, _NEO4J_QUERIES["episodes_page"],
+            skip=(ep_page - 1) * _EPISODES_PAGE_SIZE, size=_EPISODES_PAGE_SIZE,
+        ) if n_episodes else None
+
         # ── Interactive Graph ────────────────────────────────────────────────
         with neo_tab_graph:
             gcol1, gcol2 = st.columns([1, 4])
             with gcol1:
-                _all_label = t("neo4j.filter_all", lang)
+                _all_label = t_plain("neo4j.filter_all", lang)
                 label_options = [_all_label] + [l["label"] for l in lbl_data]
-                lbl_filter = st.selectbox(t("neo4j.filter_label", lang), label_options, key="neo_lbl")
-                max_nodes = st.slider(t("neo4j.max_nodes", lang), 10, 500, 100, key="neo_max")
-                physics_on = st.checkbox(t("neo4j.physics", lang), True, key="neo_phys")
+                lbl_filter = st.selectbox(t_plain("neo4j.filter_label", lang), label_options, key="neo_lbl")
+                max_nodes = st.slider(t_plain("neo4j.max_nodes", lang), 10, 500, 100, key="neo_max")
+                physics_on = st.checkbox(t_plain("neo4j.physics", lang), True, key="neo_phys")
+                # The graph is only fetched and embedded once asked for; then it stays on
+                if st.button(t_plain("neo4j.render_graph", lang), key="neo_render"):
+                    st.session_state["neo_graph_on"] = True
 
             with gcol2:
                 if n_nodes == 0:
-                    st.warning(t("neo4j.no_nodes", lang))
+                    st.warning(t_plain("neo4j.no_nodes", lang))
+                elif not st.session_state.get("neo_graph_on"):
+                    st.info(t_plain("neo4j.render_hint", lang))
                 else:
-                    with st.spinner(t("neo4j.building", lang)):
-                        if lbl_filter != _all_label:
-                            nodes_q = f"MATCH (n:{lbl_filter}) RETURN n, labels(n) AS labels LIMIT $lim"
-                        else:
-                            nodes_q = "MATCH (n) RETURN n, labels(n) AS labels LIMIT $lim"
-                        raw_nodes = _neo4j_query(_driver, nodes_q, lim=max_nodes)
-
-                        rels_q = (
-                            "MATCH (a)-[r]->(b) "
-                            "RETURN a.uuid AS a_uuid, a.name AS a_name, labels(a) AS a_labels, "
-                            "       b.uuid AS b_uuid, b.name AS b_name, labels(b) AS b_labels, "
-                            "       type(r) AS rel_type, properties(r) AS rel_props "
-                            "LIMIT $lim"
-                        )
-                        raw_rels = _neo4j_query(_driver, rels_q, lim=max_nodes * 2)
-
-                        net = Network(
-                            height="650px", width="100%",
-                            bgcolor="#1a1a2e", font_color="white",
-                            directed=True, notebook=False,
-                        )
-                        if physics_on:
-                            net.force_atlas_2based(
-                                gravity=-50, central_gravity=0.01,
-                                spring_length=150, spring_strength=0.08, damping=0.4,
+                    with st.spinner(t_plain("neo4j.building", lang)):
+                        try:
+                            nodes, edges = _neo4j_graph_view(
+                                _driver, _effective_neo4j_uri,
+                                lbl_filter if lbl_filter != _all_label else "",
+                                max_nodes, (n_nodes, n_rels), lang,
                             )
+                        except _NEO4J_UNAVAILABLE as exc:
+                            st.error(t("neo4j.error", lang, e=exc))
                         else:
-                            net.toggle_physics(False)
-
-                        seen = set()
-
-                        def _add_node(nid, name, labels_list):
-                            if nid in seen:
-                                return
-                            seen.add(nid)
-                            pl = labels_list[0] if labels_list else t("neo4j.unknown", lang)
-                            color = _NEO4J_LABEL_COLORS.get(pl, _NEO4J_DEFAULT_COLOR)
-                            sz = 25 if pl == "Episodic" else 18
-                            net.add_node(
-                                nid, label=str(name or "?")[:30],
-                                title=f"<b>{name}</b><br>{t('neo4j.label', lang)}: {pl}",
-                                color=color, size=sz,
-                                font={"size": 12, "color": "white"},
-                            )
-
-                        for r in raw_rels:
-                            a_id = r["a_uuid"] or r["a_name"] or "a?"
-                            b_id = r["b_uuid"] or r["b_name"] or "b?"
-                            _add_node(a_id, r["a_name"], r["a_labels"])
-                            _add_node(b_id, r["b_name"], r["b_labels"])
-
-                            props = r.get("rel_props") or {}
-                            fact = str(props.get("fact", ""))[:200]
-                            title = f"<b>{r['rel_type']}</b>"
-                            if fact:
-                                title += f"<br>{fact}"
-
-                            net.add_edge(
-                                a_id, b_id,
-                                title=title,
-                                label=r["rel_type"][:20],
-                                color="#78909C", arrows="to",
-                                font={"size": 8, "color": "#aaa"},
-                            )
-
-                        for rec in raw_nodes:
-                            n = rec["n"]
-                            nid = n.get("uuid") or n.get("name") or str(id(n))
-                            _add_node(nid, n.get("name"), rec["labels"])
-
-                        with tempfile.NamedTemporaryFile(
-                            delete=False, suffix=".html", mode="w", encoding="utf-8"
-                        ) as tmp:
-                            net.save_graph(tmp.name)
-                            with open(tmp.name, "r", encoding="utf-8") as fh:
-                                html = fh.read()
+                            html = _render_graph_html(nodes, edges, physics_on)
                             st.components.v1.html(html, height=680, scrolling=False)
 
-                        st.caption(t("neo4j.showing", lang, n=len(seen), r=len(raw_rels)))
+                            st.caption(t("neo4j.showing", lang, n=len(nodes[0]), r=len(edges)))
 
         # ── Episodes ─────────────────────────────────────────────────────────
+        eps, eps_error = [], None
+        if eps_future:
+            try:
+                eps = eps_future.result()
+            except _NEO4J_UNAVAILABLE as exc:
+                eps_error = exc
+
         with neo_tab_episodes:
-            eps = _neo4j_query(_driver,
-                "MATCH (e) WHERE 'Episodic' IN labels(e) "
-                "RETURN e.name AS name, e.created_at AS created, "
-                "e.group_id AS group_id, e.source_description AS source "
-                "ORDER BY e.created_at")
-            if eps:
-                st.subheader(t("neo4j.episodes_header", lang, n=len(eps)))
-                for ep in eps:
-                    with st.expander(ep.get("name") or "unnamed"):
-                        st.json(ep)
+            if eps_error:
+                st.error(t("neo4j.error", lang, e=eps_error))
+            elif eps:
+                # Compact list for the page; only the selected episode's JSON is rendered.
+                st.dataframe(
+                    pd.DataFrame(eps, columns=["name", "created", "group_id"]),
+                    width="stretch", hide_index=True,
+                )
+                ep_idx = st.selectbox(
+                    t_plain("neo4j.episode_select", lang), range(len(eps)),
+                    format_func=lambda i: eps[i].get("name") or "unnamed", key="neo_ep_sel",
+                )
+                st.code(json.dumps(eps[ep_idx], indent=2, sort_keys=True, default=str), language="json")
             else:
-                st.info(t("neo4j.no_episodes", lang))
+                st.info(t_plain("neo4j.no_episodes", lang))
 
         # ── Details ──────────────────────────────────────────────────────────
         with neo_tab_details:
             dc1, dc2 = st.columns(2)
             with dc1:
-                st.subheader(t("neo4j.node_labels", lang))
-                for l in lbl_data:
-                    clr = _NEO4J_LABEL_COLORS.get(l["label"], _NEO4J_DEFAULT_COLOR)
-                    st.markdown(
-                        f'<span style="color:{clr};font-weight:600">{l["label"]}</span>: {l["count"]}',
-                        unsafe_allow_html=True)
+                st.subheader(t_plain("neo4j.node_labels", lang))
+                st.markdown(
+                    "<br>".join(
+                        _NEO4J_LABEL_TMPL.format(
+                            clr=_NEO4J_LABEL_COLORS.get(l["label"], _NEO4J_DEFAULT_COLOR), **l)
+                        for l in lbl_data
+                    ),
+                    unsafe_allow_html=True)
             with dc2:
-                st.subheader(t("neo4j.rel_types", lang))
-                rel_types = _neo4j_query(_driver,
-                    "MATCH ()-[r]->() RETURN type(r) AS type, count(*) AS count ORDER BY count DESC")
-                for rt in rel_types:
-                    st.markdown(f'`{rt["type"]}`: {rt["count"]}')
+                st.subheader(t_plain("neo4j.rel_types", lang))
+                st.markdown("  \n".join(f'`{rt["type"]}`: {rt["count"]}' for rt in rel_types))
 
         # ── Custom Query ─────────────────────────────────────────────────────
         with neo_tab_query:
-            st.subheader(t("neo4j.cypher_header", lang))
-            default_cypher = "MATCH (n) RETURN n.name AS name, labels(n) AS labels LIMIT 25"
-            cypher = st.text_area(t("neo4j.cypher_label", lang), value=default_cypher, height=100, key="neo_cypher")
-            if st.button(t("neo4j.cypher_btn", lang), key="neo_exec"):
-                try:
-                    result = _neo4j_query(_driver, cypher)
-                    if result:
-                        st.dataframe(result, width="stretch")
-                    else:
-                        st.info(t("neo4j.cypher_no_results", lang))
-                except Exception as qe:
-                    st.error(t("neo4j.cypher_error", lang, e=qe))
-
-        _driver.close()
\ No newline at end of file
+            st.subheader(t_plain("neo4j.cypher_header", lang))
+            # Literals go in the parameters box so Neo4j can reuse the cached plan
+            default_cypher = "MATCH (n) RETURN n.name AS name, labels(n) AS labels LIMIT $limit"
+            cypher = st.text_area(t_plain("neo4j.cypher_label", lang), value=default_cypher, height=100, key="neo_cypher")
+            params_json = st.text_area(t_plain("neo4j.cypher_params", lang), value='{"limit": 25}', height=68, key="neo_cypher_params")
+            force_run = st.checkbox(t_plain("neo4j.cypher_force", lang), False, key="neo_force")
+            allow_write = st.checkbox(t_plain("neo4j.cypher_write", lang), False, key="neo_write")
+            if st.button(t_plain("neo4j.cypher_btn", lang), key="neo_exec"):
+                _access_mode = neo4j.WRITE_ACCESS if allow_write else neo4j.READ_ACCESS
+                with _driver.session(database="neo4j", default_access_mode=_access_mode) as query_session:
+                    try:
+                        cypher_params = json.loads(params_json or "{}")
+                        if not isinstance(cypher_params, dict):
+                            raise ValueError(t_plain("neo4j.cypher_params_error", lang))
+                        problems = [] if force_run else _cypher_preflight(query_session, cypher, cypher_params)
+                        for problem in problems:
+                            st.warning(problem)
+                        if not problems:
+                            result = _neo4j_df(query_session, cypher, cypher_params)
+                            if not result.empty:
+                                st.dataframe(result, width="stretch")
+                            else:
+                                st.info(t_plain("neo4j.cypher_no_results", lang))
+                    except Exception as qe:
+                        st.error(t("neo4j.cypher_error", lang, e=qe))
@@ -6,8 +6,14 @@ Usage:
     from dashboard.i18n import t, LANGUAGES
     # Set language via st.session_state["lang"] = "es" | "en"
     label = t("sidebar.title")
+    label = t_plain("sidebar.title", lang)  # no placeholders: skips formatting
 """
 
+import string
+import sys
+import types
+from functools import lru_cache
+
 LANGUAGES = {"🇦🇷 Español": "es", "🇺🇸 English": "en"}
 
 TRANSLATIONS: dict[str, dict[str, str]] = {
@@ -23,6 +29,7 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
     "sidebar.provider": {"es": "Proveedor LLM: **{p}**", "en": "LLM Provider: **{p}**"},
     "sidebar.actions": {"es": "Acciones", "en": "Actions"},
     "sidebar.clear_btn": {"es": "🗑️ Limpiar Logs & BD", "en": "🗑️ Clear Logs & DB"},
+    "sidebar.confirm": {"es": "Habilitar acciones (borran o re-procesan datos)", "en": "Enable actions (they delete or reprocess data)"},
     "sidebar.clear_ok": {"es": "¡Logs y base de datos limpiados!", "en": "Logs and Database Cleared!"},
     "sidebar.hydrate_btn": {"es": "💧 Re-hidratar Grafo (Forzar)", "en": "💧 Re-hydrate Graph (Force)"},
     "sidebar.hydrate_help": {"es": "Envía todos los docs a Neo4j", "en": "Push all docs to Neo4j"},
@@ -248,6 +255,11 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
     "proj.unit_costs": {"es": "Ver costos unitarios utilizados", "en": "View unit costs used"},
     "proj.source_logs": {"es": "desde logs", "en": "from logs"},
     "proj.source_default": {"es": "estimaciones por defecto", "en": "default estimates"},
+    "proj.sensitivity": {"es": "Sensibilidad: total / mes por documentos y búsquedas", "en": "Sensitivity: total / month by documents and searches"},
+    "proj.sensitivity_caption": {
+        "es": "Con {n} piezas generadas / mes. Rango: 0 a 2× los valores actuales.",
+        "en": "With {n} generated pieces / month. Range: 0 to 2× the current values.",
+    },
 
     # ── Neo4j tab ────────────────────────────────────────────────────────────
     "neo4j.header": {"es": "Explorador de Grafo Neo4j", "en": "Neo4j Graph Explorer"},
@@ -267,33 +279,152 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
     "neo4j.physics": {"es": "Física", "en": "Physics"},
     "neo4j.no_nodes": {"es": "No hay nodos en la base de datos.", "en": "No nodes in database."},
     "neo4j.building": {"es": "Construyendo grafo...", "en": "Building graph..."},
+    "neo4j.render_graph": {"es": "🕸️ Mostrar grafo", "en": "🕸️ Render graph"},
+    "neo4j.render_hint": {
+        "es": "Ajustá los filtros y pulsá **Mostrar grafo** para cargar la visualización.",
+        "en": "Adjust the filters and press **Render graph** to load the visualization.",
+    },
     "neo4j.showing": {"es": "Mostrando {n} nodos, {r} relaciones", "en": "Showing {n} nodes, {r} relationships"},
     "neo4j.label": {"es": "Etiqueta", "en": "Label"},
     "neo4j.unknown": {"es": "Desconocido", "en": "Unknown"},
     "neo4j.episodes_header": {"es": "Episodios ingestados ({n})", "en": "Ingested Episodes ({n})"},
+    "neo4j.episodes_page": {"es": "Página (de {n})", "en": "Page (of {n})"},
+    "neo4j.episode_select": {"es": "Ver detalle del episodio", "en": "Show episode details"},
     "neo4j.no_episodes": {"es": "No se encontraron nodos episódicos.", "en": "No episodic nodes found."},
     "neo4j.node_labels": {"es": "Labels de Nodos", "en": "Node Labels"},
     "neo4j.rel_types": {"es": "Tipos de Relación", "en": "Relationship Types"},
     "neo4j.cypher_header": {"es": "Ejecutar Query Cypher", "en": "Run Cypher Query"},
     "neo4j.cypher_label": {"es": "Cypher", "en": "Cypher"},
+    "neo4j.cypher_params": {"es": "Parámetros (JSON)", "en": "Parameters (JSON)"},
+    "neo4j.cypher_params_error": {
+        "es": "Los parámetros deben ser un objeto JSON",
+        "en": "Parameters must be a JSON object",
+    },
     "neo4j.cypher_btn": {"es": "Ejecutar", "en": "Execute"},
+    "neo4j.cypher_force": {"es": "Ejecutar sin validación previa", "en": "Run without preflight checks"},
+    "neo4j.cypher_write": {"es": "Permitir escritura", "en": "Allow writes"},
+    "neo4j.cypher_warn_varlength": {
+        "es": "La query usa un camino de longitud variable (`*`) sin `LIMIT`. Agregá un `LIMIT` o forzá la ejecución.",
+        "en": "The query uses a variable-length path (`*`) without `LIMIT`. Add a `LIMIT` or force execution.",
+    },
+    "neo4j.cypher_warn_rows": {
+        "es": "El planner estima ~{n} filas. Acotá la query o forzá la ejecución.",
+        "en": "The planner estimates ~{n} rows. Narrow the query or force execution.",
+    },
     "neo4j.cypher_no_results": {"es": "La query no devolvió resultados.", "en": "Query returned no results."},
     "neo4j.cypher_error": {"es": "Error en query: {e}", "en": "Query error: {e}"},
 }
 
 
+# Read-only after import: keys interned so lookups with interned keys hit on identity
+TRANSLATIONS = types.MappingProxyType(
+    {sys.intern(key): entry for key, entry in TRANSLATIONS.items()}
+)
+
+# (lang, key) -> text for every supported language, with the English text (or
+# the "[key]" marker) filled in where an entry lacks that language, so t()
+# resolves with a single lookup.
+_FLAT: dict[tuple[str, str], str] = {
+    (sys.intern(lang), key): entry.get(lang, entry.get("en", f"[{key}]"))
+    for key, entry in TRANSLATIONS.items()
+    for lang in LANGUAGES.values()
+}
+
+# Labels without placeholders, per language: returned as-is by t()
+_RENDERED: dict[str, dict[str, str]] = {lang: {} for lang in LANGUAGES.values()}
+for (_lang, _key), _text in _FLAT.items():
+    if not (isinstance(_text, str) and "{" in _text):
+        _RENDERED[_lang][_key] = _text
+del _lang, _key, _text
+
+
 def t(key: str, lang: str = "es", **kwargs) -> str:
     """
     Translate a key to the given language.
     Extra kwargs are used for string formatting: t("key.with.{x}", x="value").
     """
-    entry = TRANSLATIONS.get(key)
-    if entry is None:
-        return f"[{key}]"  # missing key fallback
-    text = entry.get(lang, entry.get("en", f"[{key}]"))
-    if kwargs:
-        try:
-            text = text.format(**kwargs)
-        except KeyError:
-            pass
+    rendered = _RENDERED.get(lang)
+    if rendered is not None:
+        text = rendered.get(key)
+        if text is not None:
+            return text
+    text = _FLAT.get((lang, key))
+    if text is None:
+        text = _FLAT.get(("en", key), f"[{key}]")
+    if not kwargs or "{" not in text:
+        return text
+    items = tuple(sorted(kwargs.items()))
+    value_types = tuple(type(v) for _, v in items)
+    if _CACHEABLE_TYPES.issuperset(value_types):
+        return _format_cached(text, items, value_types)
+    # Exceptions and other objects would be kept alive by the cache
+    return _format(text, items)
+
+
+_flat_get = _FLAT.get
+
+
+def t_plain(key: str, lang: str = "es") -> str:
+    """t() for labels without placeholders: lookup and fallback only."""
+    text = _flat_get((lang, key))
+    if text is None:
+        text = _flat_get(("en", key), f"[{key}]")
     return text
+
+
+@lru_cache(maxsize=64)
+def tab_labels(lang: str, prefix: str) -> types.MappingProxyType:
+    """
+    Every unformatted label under ``prefix.`` for one language, keyed by the
+    rest of the key: tab_labels("es", "ingest")["header"] == t("ingest.header", "es").
+    Built once per (lang, prefix); templates with fields still go through t().
+    """
+    head = prefix + "."
+    return types.MappingProxyType({
+        key[len(head):]: t(key, lang)
+        for key in TRANSLATIONS
+        if key.startswith(head)
+    })
+
+
+def _compile(text: str):
+    """(literal, field) pairs for a template of plain {name} fields, else None."""
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(text):
+        if spec or conversion or (field is not None and not field.isidentifier()):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+# Templates parsed once at import; anything _compile can't express goes through str.format
+_TEMPLATES = {
+    text: parts
+    for text in _FLAT.values()
+    if isinstance(text, str) and "{" in text and (parts := _compile(text)) is not None
+}
+
+
+def _format(text: str, items: tuple) -> str:
+    kwargs = dict(items)
+    parts = _TEMPLATES.get(text)
+    try:
+        if parts is None:
+            return text.format(**kwargs)
+        return "".join(
+            literal if field is None else literal + format(kwargs[field])
+            for literal, field in parts
+        )
+    except KeyError:
+        return text
+
+
+# Reruns format the same (text, kwargs) pairs over and over; the cache key is
+# the resolved text, so both languages coexist without clearing on a switch.
+# ``value_types`` only widens the key: 1, 1.0 and True hash and compare equal.
+@lru_cache(maxsize=4096)
+def _format_cached(text: str, items: tuple, value_types: tuple) -> str:
+    return _format(text, items)
+
+
+_CACHEABLE_TYPES = frozenset({str, int, float, bool})
@@ -1,39 +1,113 @@
+import io
 import pandas as pd
 import os
 import logging
+import threading
+import streamlit as st
 from poc.logging_utils import INGESTION_LOG_PATH, SEARCH_LOG_PATH, GENERATION_LOG_PATH
 
 logger = logging.getLogger(__name__)
 
-def load_ingestion_data() -> pd.DataFrame:
-    if not os.path.exists(INGESTION_LOG_PATH):
-        return pd.DataFrame()
+# Lector CSV multihilo de pyarrow si está instalado; si no, el parser C de pandas
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
+
+def _epoch_to_datetime(values: pd.Series) -> pd.Series:
+    """Epoch seconds -> datetime64[ms] by reinterpreting int64 millis, no per-element parse."""
+    if pd.api.types.is_numeric_dtype(values) and not values.hasnans:
+        millis = (values.to_numpy(dtype="float64") * 1000).astype("int64")
+        return pd.Series(millis.view("datetime64[ms]"), index=values.index, name=values.name)
+    return pd.to_datetime(values, unit="s", errors="coerce")
+
+
+def _parse_log_csv(data: bytes, **kwargs) -> pd.DataFrame:
+    """Parse CSV bytes, converting the epoch ``timestamp`` column if present."""
     try:
-        df = pd.read_csv(INGESTION_LOG_PATH)
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-        return df
-    except Exception as e:
-        logger.error(f"Error loading ingestion data: {e}")
+        df = pd.read_csv(io.BytesIO(data), engine=_CSV_ENGINE, **kwargs)
+    except pd.errors.EmptyDataError:
         return pd.DataFrame()
+    except ValueError:
+        # pyarrow rejects ragged rows the C parser tolerates
+        try:
+            df = pd.read_csv(io.BytesIO(data), **kwargs)
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+    if "timestamp" in df.columns:
+        df["timestamp"] = _epoch_to_datetime(df["timestamp"])
+    return df
 
-def load_search_data() -> pd.DataFrame:
-    if not os.path.exists(SEARCH_LOG_PATH):
-        return pd.DataFrame()
+
+# Leading bytes compared to tell an appended log from a reset one reusing the inode
+_LOG_HEAD_BYTES = 512
+
+
+@st.cache_resource(show_spinner=False)
+def _log_tails() -> tuple:
+    """
+    path -> (inode, head bytes, bytes parsed, DataFrame) of each log's last
+    parse, plus the lock guarding it. Shared by all sessions so appends are
+    parsed once.
+    """
+    return {}, threading.Lock()
+
+
+@st.cache_data(show_spinner=False, max_entries=6)
+def read_log(path: str, mtime: float, size: int) -> pd.DataFrame:
+    """
+    Parse a CSV log. The loggers only append, so when the file is the same
+    one as last time (inode and leading bytes match) and has grown, only the
+    complete rows after the last parsed offset are read and concatenated; a
+    reset (new file) or shrink triggers a full parse. mtime/size only key the
+    cache; max_entries evicts stale versions.
+    """
+    tails, lock = _log_tails()
+    with lock, open(path, "rb") as fh:
+        inode = os.fstat(fh.fileno()).st_ino
+        head = fh.read(_LOG_HEAD_BYTES)
+        prev = tails.get(path)
+        if (prev and prev[0] == inode and prev[1] == head[:len(prev[1])]
+                and prev[2] <= size and len(prev[3].columns)):
+            fh.seek(prev[2])
+            new = fh.read()
+            cut = new.rfind(b"\n") + 1  # a row still being written waits for the next pass
+            df = prev[3]
+            if cut:
+                part = _parse_log_csv(new[:cut], header=None, names=list(df.columns))
+                df = pd.concat([df, part], ignore_index=True) if len(df) else part
+            offset = prev[2] + cut
+        else:
+            data = head + fh.read()
+            offset = data.rfind(b"\n") + 1 or len(data)
+            df = _parse_log_csv(data[:offset])
+        tails[path] = (inode, head[:offset], offset, df)
+    return df
+
+
+def _load_log(path: str, label: str) -> pd.DataFrame:
     try:
-        df = pd.read_csv(SEARCH_LOG_PATH)
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-        return df
-    except Exception as e:
-        logger.error(f"Error loading search data: {e}")
+        stat = os.stat(path)
+    except OSError:
         return pd.DataFrame()
-
-def load_generation_data() -> pd.DataFrame:
-    if not os.path.exists(GENERATION_LOG_PATH):
+    if not stat.st_size:
         return pd.DataFrame()
     try:
-        df = pd.read_csv(GENERATION_LOG_PATH)
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-        return df
+        return read_log(path, stat.st_mtime, stat.st_size)
     except Exception as e:
-        logger.error(f"Error loading generation data: {e}")
+        logger.error(f"Error loading {label} data: {e}")
         return pd.DataFrame()
+
+
+def load_ingestion_data() -> pd.DataFrame:
+    return _load_log(INGESTION_LOG_PATH, "ingestion")
+
+
+def load_search_data() -> pd.DataFrame:
+    return _load_log(SEARCH_LOG_PATH, "search")
+
+
+def load_generation_data() -> pd.DataFrame:
+    return _load_log(GENERATION_LOG_PATH, "generation")
@@ -1,13 +1,17 @@
 import asyncio
-import json
 from agent.db_utils import DatabasePool
 
 async def check():
     await DatabasePool.init_db()
     pool = await DatabasePool.get_pool()
-    rows = await pool.fetch("SELECT count(*) as count, (metadata->>'graph_ingested')::boolean IS TRUE as ingested FROM documents GROUP BY ingested")
-    data = [dict(r) for r in rows]
-    print(json.dumps(data, indent=2))
+    # Postgres arma el JSON: un solo round-trip y sin dicts en Python
+    data = await pool.fetchval(
+        "SELECT json_agg(row_to_json(t)) FROM ("
+        "SELECT count(*) AS count, "
+        "COALESCE((metadata->>'graph_ingested')::boolean, false) AS ingested "
+        "FROM documents GROUP BY 2) t"
+    )
+    print(data or "[]")
     await DatabasePool.close()
 
 if __name__ == "__main__":
@@ -1,4 +1,3 @@
-import re
 from typing import List, Optional
 
 
@@ -21,6 +20,15 @@ class RecursiveChunker:
         raw = self._split_text(text, self.separators)
         return [c for c in raw if c.strip()]
 
+    def chunk_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        Chunking por lotes; equivale a ``[self.chunk(t) for t in texts]``.
+        Cada documento elige su propio separador, asi que no se concatenan.
+        """
+        split = self._split_text
+        separators = self.separators
+        return [[c for c in split(t, separators) if c.strip()] for t in texts]
+
     def _split_text(self, text: str, separators: List[str]) -> List[str]:
         final_chunks: List[str] = []
 
@@ -30,41 +38,47 @@ class RecursiveChunker:
             if sep == "":
                 separator = ""
                 break
-            if re.search(re.escape(sep), text):
+            if sep in text:
                 separator = sep
                 next_seps = separators[i + 1:]
                 break
 
-        splits = text.split(separator) if separator else list(text)
+        if not separator:
+            return self._split_chars(text)
+
+        splits = text.split(separator)
+        sep_len = len(separator)
+        chunk_size = self.chunk_size
+        chunk_overlap = self.chunk_overlap
 
         current: List[str] = []
         current_len = 0
 
         for split in splits:
-            split_len = len(split) + (len(separator) if current else 0)
+            split_len = len(split) + (sep_len if current else 0)
 
-            if current_len + split_len > self.chunk_size:
+            if current_len + split_len > chunk_size:
                 if current:
                     final_chunks.append(separator.join(current))
 
                     # Overlap: mantener los últimos N chars como contexto
-                    overlap: List[str] = []
+                    # (se busca el corte hacia atrás y se toma un solo slice)
+                    start = len(current)
                     overlap_len = 0
-                    for part in reversed(current):
-                        part_len = len(part) + len(separator)
-                        if overlap_len + part_len > self.chunk_overlap:
+                    while start:
+                        part_len = len(current[start - 1]) + sep_len
+                        if overlap_len + part_len > chunk_overlap:
                             break
-                        overlap.insert(0, part)
+                        start -= 1
                         overlap_len += part_len
-                    current = overlap
+                    current = current[start:]
                     current_len = overlap_len
 
-                if len(split) > self.chunk_size:
+                if len(split) > chunk_size:
                     if next_seps:
-                        sub = self._split_text(split, next_seps)
-                        final_chunks.extend(sub)
+                        final_chunks.extend(self._split_text(split, next_seps))
                     else:
-                        final_chunks.append(split[: self.chunk_size])
+                        final_chunks.append(split[:chunk_size])
                 else:
                     current.append(split)
                     current_len += split_len
@@ -77,7 +91,33 @@ class RecursiveChunker:
 
         return final_chunks
 
+    def _split_chars(self, text: str) -> List[str]:
+        """
+        Nivel caracter: ventanas de ``chunk_size`` que avanzan
+        ``chunk_size - chunk_overlap``; mismo resultado que fusionar
+        caracter a caracter, pero con slices en C.
+        """
+        size = self.chunk_size
+        step = size - self.chunk_overlap
+        n = len(text)
+        chunks: List[str] = []
+        start = 0
+        while start < n:
+            chunks.append(text[start:start + size])
+            if start + size >= n:
+                break
+            start += step
+        return chunks
+
 
 # Alias para compatibilidad con ingest.py original
 class SemanticChunker(RecursiveChunker):
-    pass
\ No newline at end of file
+    pass
+
+
+# Instancia compartida con los parametros por defecto (800/100)
+default_chunker = RecursiveChunker()
+
+
+def chunk(text: str) -> List[str]:
+    return default_chunker.chunk(text)
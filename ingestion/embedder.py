@@ -1,8 +1,18 @@
 import asyncio
+import base64
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+import random
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
 
-from openai import AsyncOpenAI, RateLimitError
+import numpy as np
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
 
 from poc.config import config
 from poc.token_tracker import tracker
@@ -10,9 +20,95 @@ from poc.token_tracker import tracker
 logger = logging.getLogger(__name__)
 
 _CACHE_MAX = 256
+# Ventana para agrupar llamadas concurrentes a generate_embedding en un request
+_BATCH_WINDOW_S = 0.005
+# Reintentos ante 429 (no de cuota) / 5xx / errores de conexión
+_EMBED_RETRIES = 4
+
+
+def _backoff(attempt: int) -> float:
+    return min(60.0, 2 ** attempt + random.random())
+
+
+def _decode_vector(data) -> np.ndarray:
+    """Vector de la respuesta cruda: base64 de float32 (OpenAI) o lista JSON (Ollama)."""
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype=np.float32)
+    return np.asarray(data, dtype=np.float32)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, RateLimitError):
+        return getattr(exc, "code", None) != "insufficient_quota"
+    if isinstance(exc, (InternalServerError, APIConnectionError)):
+        return True
+    try:
+        from google.api_core import exceptions as gexc
+    except ImportError:
+        return False
+    return isinstance(exc, (gexc.ResourceExhausted, gexc.ServiceUnavailable, gexc.InternalServerError))
+
+
+def _per_loop(mapping: "weakref.WeakKeyDictionary", loop: asyncio.AbstractEventLoop, factory):
+    """Valor de ``mapping`` para ``loop``; al crear uno nuevo descarta los loops cerrados."""
+    value = mapping.get(loop)
+    if value is None:
+        # Los valores pueden referenciar a su loop (Future, Semaphore): la referencia
+        # débil no alcanza para liberar los de asyncio.run() ya terminados.
+        for old in [l for l in mapping if l.is_closed()]:
+            del mapping[old]
+        value = mapping[loop] = factory()
+    return value
+
+
 _embedder_instance: Optional["EmbeddingGenerator"] = None
 
 
+class _EmbeddingStore:
+    """
+    Cache persistente de embeddings en SQLite (WAL).
+    Clave: blake2b(modelo + texto limpio); vector guardado como float32.
+    """
+
+    _QUERY_CHUNK = 500  # límite de parámetros por SELECT ... IN (...)
+
+    def __init__(self, path: str, model: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._model = model
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+
+    def _key(self, clean: str) -> bytes:
+        return hashlib.blake2b(f"{self._model}\0{clean}".encode(), digest_size=16).digest()
+
+    def get_many(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        keys = {self._key(t): t for t in texts}
+        found: Dict[str, np.ndarray] = {}
+        key_list = list(keys)
+        with self._lock:
+            for i in range(0, len(key_list), self._QUERY_CHUNK):
+                chunk = key_list[i:i + self._QUERY_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, vec in rows:
+                    found[keys[key]] = np.frombuffer(vec, dtype=np.float32)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        rows = [
+            (self._key(t), np.asarray(v, dtype=np.float32).tobytes())
+            for t, v in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR IGNORE INTO embeddings VALUES (?, ?)", rows)
+
+
 def get_embedder() -> "EmbeddingGenerator":
     """Retorna el singleton del EmbeddingGenerator. Thread-safe para asyncio."""
     global _embedder_instance
@@ -33,7 +129,20 @@ class EmbeddingGenerator:
         self.provider = config.LLM_PROVIDER.lower()
         self.model = config.EMBEDDING_MODEL
         self.dims = config.EMBEDDING_DIMS
-        self._cache: Dict[str, List[float]] = {}
+        # LRU: texto limpio -> (vector float32, tokens); tokens None hasta el primer hit.
+        # float32 ocupa ~7x menos que una lista de floats de Python.
+        self._cache: "OrderedDict[str, Tuple[np.ndarray, Optional[int]]]" = OrderedDict()
+        self._store_path = config.EMBEDDING_CACHE_FILE
+        self._store: Optional[_EmbeddingStore] = None
+        self._concurrency = max(1, config.EMBED_CONCURRENCY)
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Batch abierto por event loop: texto limpio -> Future[(vector, tokens)]
+        self._pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._flush_tasks: Set[asyncio.Task] = set()
 
         logger.info(
             "EmbeddingGenerator: provider=%s, model=%s, dims=%d",
@@ -44,6 +153,8 @@ class EmbeddingGenerator:
             client_kwargs = {
                 "api_key": config.OPENAI_API_KEY,
                 "timeout": 60.0,
+                # Los reintentos los hace _call_provider (con límite de concurrencia)
+                "max_retries": 0,
             }
             if config.OPENAI_BASE_URL:
                 client_kwargs["base_url"] = config.OPENAI_BASE_URL
@@ -61,26 +172,80 @@ class EmbeddingGenerator:
 
     async def generate_embedding(self, text: str) -> Tuple[List[float], int]:
         """
-        Embedding para un texto individual. Usa cache para queries repetidas.
+        Embedding para un texto individual. Usa cache para queries repetidas;
+        las llamadas concurrentes dentro de _BATCH_WINDOW_S comparten un request.
         Retorna (vector, token_count_estimado).
         """
         clean = text.replace("\n", " ").strip()
         if not clean:
             return [0.0] * self.dims, 0
 
-        if clean in self._cache:
-            return self._cache[clean], tracker.estimate_tokens(clean)
-
-        embedding, tokens = await self._embed_fn([clean])
-        vector = embedding[0]
-
-        # Eviction FIFO simple
-        if len(self._cache) >= _CACHE_MAX:
-            oldest = next(iter(self._cache))
-            del self._cache[oldest]
-        self._cache[clean] = vector
-
-        return vector, tokens
+        hit = self._cache_get(clean)
+        if hit is not None:
+            vector, tokens = hit
+            if tokens is None:
+                tokens = tracker.estimate_tokens(clean)
+                self._cache[clean] = (vector, tokens)
+            return vector.tolist(), tokens
+
+        vector, tokens = await self._coalesced_embed(clean)
+        self._cache_put(clean, vector)
+
+        return vector.tolist(), tokens
+
+    async def _coalesced_embed(self, clean: str) -> Tuple[np.ndarray, int]:
+        loop = asyncio.get_running_loop()
+        if loop not in self._pending:
+            loop.call_later(_BATCH_WINDOW_S, self._start_flush, loop)
+        batch = _per_loop(self._pending, loop, dict)
+        future = batch.get(clean)
+        if future is None:
+            future = batch[clean] = loop.create_future()
+        # shield: cancelar a un llamador no cancela el resultado de los demás
+        return await asyncio.shield(future)
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._pending.pop(loop, None)
+        if batch:
+            # Referencia fuerte: el loop solo guarda referencias débiles a las tasks
+            task = loop.create_task(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: Dict[str, asyncio.Future]) -> None:
+        """Resuelve todos los futures del batch; ninguno puede quedar pendiente."""
+        try:
+            await self._flush_batch(batch)
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except BaseException as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+    async def _flush_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        stored = await self._store_get(list(batch))
+        for text, vector in stored.items():
+            future = batch[text]
+            if not future.done():
+                future.set_result((vector, tracker.estimate_tokens(text)))
+        texts = [t for t in batch if t not in stored]
+        if not texts:
+            return
+        embeddings, tokens = await self._embed_fn(texts)
+        await self._store_put(dict(zip(texts, embeddings)))
+        if len(texts) == 1:
+            per_text = [tokens]
+        else:
+            per_text = [tracker.estimate_tokens(t) for t in texts]
+        for text, vector, text_tokens in zip(texts, embeddings, per_text):
+            future = batch[text]
+            if not future.done():
+                future.set_result((vector, text_tokens))
 
     async def generate_embeddings_batch(
         self, texts: List[str]
@@ -91,51 +256,135 @@ class EmbeddingGenerator:
         """
         cleaned = [t.replace("\n", " ").strip() for t in texts]
 
-        # Separar los que ya están en cache
-        to_embed_indices = []
+        # Separar los que ya están en cache; los repetidos del batch se piden una vez
+        pending: Dict[str, List[int]] = {}
         cached_results: Dict[int, List[float]] = {}
 
         for i, text in enumerate(cleaned):
-            if text in self._cache:
-                cached_results[i] = self._cache[text]
+            hit = self._cache_get(text)
+            if hit is not None:
+                cached_results[i] = hit[0].tolist()
             else:
-                to_embed_indices.append(i)
+                pending.setdefault(text, []).append(i)
+
+        if pending:
+            for text, stored in (await self._store_get(list(pending))).items():
+                self._cache_put(text, stored)
+                embedding = stored.tolist()
+                for idx in pending.pop(text):
+                    cached_results[idx] = embedding
 
         total_tokens = 0
-        if to_embed_indices:
-            texts_to_embed = [cleaned[i] for i in to_embed_indices]
+        if pending:
+            texts_to_embed = list(pending)
             new_embeddings, tokens = await self._embed_fn(texts_to_embed)
             total_tokens = tokens
+            await self._store_put(dict(zip(texts_to_embed, new_embeddings)))
 
-            for idx, embedding in zip(to_embed_indices, new_embeddings):
-                if len(self._cache) >= _CACHE_MAX:
-                    oldest = next(iter(self._cache))
-                    del self._cache[oldest]
-                self._cache[cleaned[idx]] = embedding
-                cached_results[idx] = embedding
+            for text, vector in zip(texts_to_embed, new_embeddings):
+                self._cache_put(text, vector)
+                embedding = vector.tolist()
+                for idx in pending[text]:
+                    cached_results[idx] = embedding
 
         # Reconstruir en orden original
         result = [cached_results[i] for i in range(len(cleaned))]
         return result, total_tokens
 
+    def _cache_get(self, clean: str) -> Optional[Tuple[np.ndarray, Optional[int]]]:
+        """(vector, tokens) si está en cache; lo marca como usado recientemente."""
+        hit = self._cache.get(clean)
+        if hit is not None:
+            self._cache.move_to_end(clean)
+        return hit
+
+    def _cache_put(self, clean: str, vector, tokens: Optional[int] = None) -> None:
+        self._cache[clean] = (np.asarray(vector, dtype=np.float32), tokens)
+        self._cache.move_to_end(clean)
+        if len(self._cache) > _CACHE_MAX:
+            self._cache.popitem(last=False)
+
+    def _get_store(self) -> Optional[_EmbeddingStore]:
+        if self._store is None and self._store_path:
+            try:
+                self._store = _EmbeddingStore(self._store_path, self.model)
+            except sqlite3.Error as e:
+                logger.warning("Cache de embeddings deshabilitado (%s): %s", self._store_path, e)
+                self._store_path = ""
+        return self._store
+
+    async def _store_get(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        store = self._get_store()
+        if store is None or not texts:
+            return {}
+        try:
+            return await asyncio.to_thread(store.get_many, texts)
+        except sqlite3.Error as e:
+            logger.warning("Error leyendo cache de embeddings: %s", e)
+            return {}
+
+    async def _store_put(self, items: Dict[str, np.ndarray]) -> None:
+        store = self._get_store()
+        if store is None or not items:
+            return
+        try:
+            await asyncio.to_thread(store.put_many, items)
+        except sqlite3.Error as e:
+            logger.warning("Error escribiendo cache de embeddings: %s", e)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Uno por loop: el singleton se usa desde el loop del dashboard y desde asyncio.run
+        return _per_loop(
+            self._semaphores, asyncio.get_running_loop(),
+            lambda: asyncio.Semaphore(self._concurrency),
+        )
+
+    async def _call_provider(self, make_call):
+        """Ejecuta ``make_call()`` con límite de concurrencia y backoff exponencial."""
+        attempt = 0
+        while True:
+            async with self._semaphore():
+                try:
+                    return await make_call()
+                except Exception as e:
+                    if attempt >= _EMBED_RETRIES or not _is_retryable(e):
+                        raise
+                    error = e
+            delay = _backoff(attempt)
+            attempt += 1
+            logger.warning(
+                "Embeddings: %s; reintento %d/%d en %.1fs",
+                type(error).__name__, attempt, _EMBED_RETRIES, delay,
+            )
+            await asyncio.sleep(delay)
+
     # =========================================================================
     # IMPLEMENTACIONES POR PROVEEDOR
     # =========================================================================
 
+    # Contrato de _embed_fn: (vectores float32 en el orden de `texts`, tokens)
+
     async def _embed_openai_compatible(
         self, texts: List[str]
-    ) -> Tuple[List[List[float]], int]:
+    ) -> Tuple[List[np.ndarray], int]:
         """
         Embedding via API compatible con OpenAI.
         Funciona para OpenAI (api.openai.com) y Ollama (localhost:11434/v1).
         """
         try:
-            response = await self.client.embeddings.create(
-                input=texts,
-                model=self.model,
+            # Respuesta cruda en base64: sin modelos Pydantic por vector ni listas de floats
+            raw = await self._call_provider(
+                lambda: self.client.embeddings.with_raw_response.create(
+                    input=texts, model=self.model, encoding_format="base64",
+                )
             )
-            embeddings = [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
-            tokens = response.usage.total_tokens if response.usage else sum(
+            payload = json.loads(raw.content)
+            data = payload["data"]
+            if any(d["index"] != i for i, d in enumerate(data)):
+                data = sorted(data, key=lambda d: d["index"])
+            embeddings = [_decode_vector(d["embedding"]) for d in data]
+            usage = payload.get("usage") or {}
+            tokens = usage.get("total_tokens") or sum(
                 tracker.estimate_tokens(t) for t in texts
             )
 
@@ -172,21 +421,23 @@ class EmbeddingGenerator:
 
     async def _embed_gemini(
         self, texts: List[str]
-    ) -> Tuple[List[List[float]], int]:
+    ) -> Tuple[List[np.ndarray], int]:
         """Embedding via Google Gemini."""
         import google.generativeai as genai
 
-        async def _embed_one(text: str) -> List[float]:
+        async def _embed_one(text: str) -> np.ndarray:
             loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: genai.embed_content(
-                    model=f"models/{self.model}",
-                    content=text,
-                    task_type="retrieval_document",
+            result = await self._call_provider(
+                lambda: loop.run_in_executor(
+                    None,
+                    lambda: genai.embed_content(
+                        model=f"models/{self.model}",
+                        content=text,
+                        task_type="retrieval_document",
+                    )
                 )
             )
-            return result["embedding"]
+            return np.asarray(result["embedding"], dtype=np.float32)
 
         embeddings = await asyncio.gather(*[_embed_one(t) for t in texts])
         total_tokens = sum(tracker.estimate_tokens(t) for t in texts)
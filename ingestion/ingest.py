@@ -14,8 +14,8 @@ from agent.db_utils import (
     mark_document_graph_ingested,
 )
 from agent.graph_utils import GraphClient
-from ingestion.chunker import SemanticChunker
-from ingestion.embedder import EmbeddingGenerator
+from ingestion.chunker import default_chunker
+from ingestion.embedder import get_embedder
 from poc.logging_utils import ingestion_logger
 from poc.token_tracker import tracker
 
@@ -24,8 +24,8 @@ logger = logging.getLogger(__name__)
 
 class DocumentIngestionPipeline:
     def __init__(self):
-        self.chunker = SemanticChunker(chunk_size=800, chunk_overlap=100)
-        self.embedder = EmbeddingGenerator()
+        self.chunker = default_chunker
+        self.embedder = get_embedder()
 
     async def ingest_file(
         self, file_path: str, skip_graphiti: bool = False
@@ -171,6 +171,24 @@ def get_budget_status() -> dict:
     }
 
 
+def get_budget_summary() -> dict:
+    """
+    Resumen del budget para el dashboard: get_budget_status() más la
+    proyección mensual y si el modelo fallback está activo.
+    """
+    status = get_budget_status()
+    spent = status["spent_usd"]
+    return {
+        "status": status["status"],
+        "spent_usd": spent,
+        "budget_usd": status["budget_usd"],
+        "percentage": status["used_pct"],
+        "projected_monthly": round(_project_monthly(spent), 4),
+        "active_model": status.get("active_model", config.DEFAULT_MODEL),
+        "fallback_active": status["status"] == "critical",
+    }
+
+
 def _project_monthly(spent_so_far: float) -> float:
     """Proyecta el gasto total del mes basado en el gasto acumulado hasta hoy."""
     now = datetime.now()
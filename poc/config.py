@@ -62,6 +62,14 @@ class AppConfig(BaseSettings):
         default=0,
         description="Dimensiones del vector. 0 = auto-detectar según proveedor."
     )
+    EMBEDDING_CACHE_FILE: str = Field(
+        default="logs/embedding_cache.sqlite",
+        description="Cache persistente de embeddings (SQLite). Vacío = desactivado."
+    )
+    EMBED_CONCURRENCY: int = Field(
+        default=8,
+        description="Requests de embeddings simultáneos al proveedor (por event loop)."
+    )
 
     # -------------------------------------------------------------------------
     # POSTGRESQL
@@ -79,6 +87,7 @@ class AppConfig(BaseSettings):
     NEO4J_URI: str = Field(default="bolt://localhost:7687")
     NEO4J_USER: str = Field(default="neo4j")
     NEO4J_PASSWORD: str = Field(default="")
+    NEO4J_POOL_SIZE: int = Field(default=20, description="Conexiones máximas del pool del dashboard.")
 
     # -------------------------------------------------------------------------
     # BUDGET GUARD
@@ -13,7 +13,7 @@ from agent.db_utils import (
     mark_document_graph_ingested,
 )
 from agent.graph_utils import GraphClient
-from ingestion.chunker import SemanticChunker
+from ingestion.chunker import SemanticChunker, default_chunker
 from ingestion.embedder import get_embedder
 from ingestion.taxonomy import TaxonomyManager
 from poc.logging_utils import ingestion_logger
@@ -57,7 +57,10 @@ class IngestionService:
     """
 
     def __init__(self, chunk_size: int = 800, chunk_overlap: int = 100):
-        self.chunker = SemanticChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        if (chunk_size, chunk_overlap) == (default_chunker.chunk_size, default_chunker.chunk_overlap):
+            self.chunker = default_chunker
+        else:
+            self.chunker = SemanticChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
         self.embedder = get_embedder()
         self.taxonomy = TaxonomyManager()
 
@@ -0,0 +1,9 @@
+from dashboard.i18n import t
+
+
+def test_equal_but_differently_typed_values_are_not_shared():
+    as_int = t("proj.sensitivity_caption", "en", n=1)
+    as_float = t("proj.sensitivity_caption", "en", n=1.0)
+    as_bool = t("proj.sensitivity_caption", "en", n=True)
+    assert "1.0" in as_float and "1.0" not in as_int
+    assert "True" in as_bool
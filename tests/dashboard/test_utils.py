@@ -0,0 +1,115 @@
+import csv
+import os
+
+from poc.logging_utils import INGESTION_HEADERS
+
+
+def _write_log(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(INGESTION_HEADERS)
+        for i in range(rows):
+            row = {h: 0 for h in INGESTION_HEADERS}
+            row.update(episodio_id=f"ep{i}", timestamp=1_700_000_000 + i,
+                       chunks_creados=i, costo_total_usd=0.00001)
+            writer.writerow([row[h] for h in INGESTION_HEADERS])
+
+
+def test_loaders_read_the_whole_log(tmp_path, monkeypatch):
+    import dashboard.utils as utils
+
+    path = tmp_path / "ingestion.csv"
+    _write_log(path, 50)
+    monkeypatch.setattr(utils, "INGESTION_LOG_PATH", str(path))
+    df = utils.load_ingestion_data()
+    assert df["episodio_id"].tolist() == [f"ep{i}" for i in range(50)]
+    assert df["costo_total_usd"].dtype == "float64"
+    assert str(df["timestamp"].dtype).startswith("datetime64")
+
+
+def test_loaders_return_empty_without_a_log(tmp_path, monkeypatch):
+    import dashboard.utils as utils
+
+    monkeypatch.setattr(utils, "SEARCH_LOG_PATH", str(tmp_path / "missing.csv"))
+    assert utils.load_search_data().empty
+
+
+def _read(path):
+    from dashboard.utils import read_log
+
+    stat = os.stat(path)
+    return read_log(str(path), stat.st_mtime, stat.st_size)
+
+
+def _rows(start, stop):
+    return "".join(f"{1_700_000_000 + i},doc{i},{i}\n" for i in range(start, stop))
+
+
+def test_read_log_parses_only_appended_rows(tmp_path):
+    from dashboard.utils import _log_tails
+
+    path = tmp_path / "log.csv"
+    path.write_text("timestamp,name,value\n" + _rows(0, 2))
+    assert _read(path)["name"].tolist() == ["doc0", "doc1"]
+
+    with open(path, "a") as f:
+        f.write(_rows(2, 4))
+    df = _read(path)
+    assert df["name"].tolist() == ["doc0", "doc1", "doc2", "doc3"]
+    assert df["value"].tolist() == [0, 1, 2, 3]
+    assert str(df["timestamp"].dtype).startswith("datetime64")
+    assert _log_tails()[0][str(path)][2] == os.path.getsize(path)
+
+
+def test_read_log_waits_for_a_partial_last_row(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("timestamp,name,value\n" + _rows(0, 1))
+    _read(path)
+
+    with open(path, "a") as f:
+        f.write(_rows(1, 2) + "1700000002,doc")
+    assert _read(path)["name"].tolist() == ["doc0", "doc1"]
+
+    with open(path, "a") as f:
+        f.write("2,2\n")
+    assert _read(path)["name"].tolist() == ["doc0", "doc1", "doc2"]
+
+
+def test_read_log_reparses_a_truncated_log(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("timestamp,name,value\n" + _rows(0, 5))
+    assert len(_read(path)) == 5
+
+    # Same inode, shorter: cleared and re-headered in place
+    with open(path, "w") as f:
+        f.write("timestamp,name,value\n" + _rows(7, 8))
+    assert _read(path)["name"].tolist() == ["doc7"]
+
+
+def test_read_log_reparses_when_the_head_changes(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("timestamp,name,value\n" + _rows(0, 1))
+    _read(path)
+
+    # Same inode and longer, but different leading bytes: a reset, not an append
+    with open(path, "w") as f:
+        f.write("timestamp,name,value,extra\n" + "".join(
+            f"{1_700_000_000 + i},new{i},{i},x\n" for i in range(3)))
+    df = _read(path)
+    assert list(df.columns) == ["timestamp", "name", "value", "extra"]
+    assert df["name"].tolist() == ["new0", "new1", "new2"]
+
+
+def test_read_log_reparses_a_replaced_file(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("timestamp,name,value\n" + _rows(0, 40))
+    _read(path)
+
+    # Same leading bytes, longer, but a new file: rows past the head changed
+    replacement = tmp_path / "log.csv.new"
+    replacement.write_text(
+        "timestamp,name,value\n" + _rows(0, 39) + "1700000039,rewritten,39\n" + _rows(40, 41))
+    os.replace(replacement, path)
+    df = _read(path)
+    assert df["name"].tolist()[-2:] == ["rewritten", "doc40"]
+    assert len(df) == 41
@@ -0,0 +1,43 @@
+from ingestion.chunker import RecursiveChunker, SemanticChunker
+
+
+def test_chunks_respect_chunk_size():
+    text = " ".join(f"word{i}" for i in range(2000))
+    chunks = RecursiveChunker(chunk_size=200, chunk_overlap=40).chunk(text)
+    assert len(chunks) > 1
+    assert all(len(c) <= 200 for c in chunks)
+
+
+def test_prefers_paragraph_boundaries():
+    text = "\n\n".join(["a" * 50, "b" * 50, "c" * 50])
+    chunks = RecursiveChunker(chunk_size=110, chunk_overlap=0).chunk(text)
+    assert chunks == ["a" * 50 + "\n\n" + "b" * 50, "c" * 50]
+
+
+def test_overlap_carries_trailing_parts():
+    text = "one two three four five six seven eight nine ten"
+    chunks = RecursiveChunker(chunk_size=20, chunk_overlap=10).chunk(text)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert nxt.split(" ")[0] in prev.split(" ")
+
+
+def test_oversized_token_is_sliced():
+    chunks = RecursiveChunker(chunk_size=100, chunk_overlap=0).chunk("x" * 250)
+    assert chunks == ["x" * 100, "x" * 100, "x" * 50]
+
+
+def test_blank_input_yields_no_chunks():
+    assert SemanticChunker().chunk("") == []
+    assert SemanticChunker().chunk(" \n\n ") == []
+
+
+def test_character_level_windows_overlap():
+    text = "".join(chr(97 + i % 26) for i in range(95))
+    chunks = RecursiveChunker(chunk_size=40, chunk_overlap=10).chunk(text)
+    assert chunks == [text[0:40], text[30:70], text[60:95]]
+
+
+def test_chunk_many_matches_per_document_chunking():
+    chunker = RecursiveChunker(chunk_size=30, chunk_overlap=5)
+    texts = ["a b c d e f g h i j k l m n o p", "x\n\ny" * 10, "", "z" * 70]
+    assert chunker.chunk_many(texts) == [chunker.chunk(t) for t in texts]
@@ -0,0 +1,210 @@
+import asyncio
+
+import numpy as np
+
+import ingestion.embedder as embedder_mod
+from ingestion.embedder import EmbeddingGenerator
+
+
+def _generator(monkeypatch, cache_max=256, store_path=""):
+    monkeypatch.setattr(embedder_mod, "_CACHE_MAX", cache_max)
+    monkeypatch.setattr(embedder_mod.config, "EMBEDDING_CACHE_FILE", store_path)
+    gen = EmbeddingGenerator()
+    calls = []
+
+    async def fake_embed(texts):
+        calls.append(list(texts))
+        return [np.array([len(t)], dtype=np.float32) for t in texts], 7 * len(texts)
+
+    gen._embed_fn = fake_embed
+    return gen, calls
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    gen, calls = _generator(monkeypatch, cache_max=2)
+
+    async def run():
+        await gen.generate_embedding("a")
+        await gen.generate_embedding("bb")
+        await gen.generate_embedding("a")    # hit: "a" becomes most recent
+        await gen.generate_embedding("ccc")  # evicts "bb", not "a"
+        await gen.generate_embedding("a")
+
+    asyncio.run(run())
+    assert calls == [["a"], ["bb"], ["ccc"]]
+    assert list(gen._cache) == ["ccc", "a"]
+    assert gen._cache["a"][0].dtype == np.float32
+
+
+def test_batch_embeds_each_unique_uncached_text_once(monkeypatch):
+    gen, calls = _generator(monkeypatch)
+
+    async def run():
+        await gen.generate_embedding("seen")
+        return await gen.generate_embeddings_batch(["x\ny", "seen", "x y", "zz", "zz"])
+
+    vectors, tokens = asyncio.run(run())
+    assert calls == [["seen"], ["x y", "zz"]]
+    assert vectors == [[3.0], [4.0], [3.0], [2.0], [2.0]]
+    assert tokens == 14
+
+
+def test_concurrent_single_embeddings_share_one_request(monkeypatch):
+    gen, calls = _generator(monkeypatch)
+
+    async def run():
+        return await asyncio.gather(
+            gen.generate_embedding("alpha"),
+            gen.generate_embedding("beta"),
+            gen.generate_embedding("alpha"),
+        )
+
+    results = asyncio.run(run())
+    assert calls == [["alpha", "beta"]]
+    assert [vector for vector, _ in results] == [[5.0], [4.0], [5.0]]
+
+
+def test_disk_cache_survives_a_new_generator(monkeypatch, tmp_path):
+    path = str(tmp_path / "emb.sqlite")
+    first, first_calls = _generator(monkeypatch, store_path=path)
+    asyncio.run(first.generate_embeddings_batch(["persisted", "also"]))
+
+    second, second_calls = _generator(monkeypatch, store_path=path)
+
+    async def run():
+        single = await second.generate_embedding("persisted")
+        batch = await second.generate_embeddings_batch(["also", "fresh"])
+        return single, batch
+
+    (vector, _), (vectors, _) = asyncio.run(run())
+    assert first_calls == [["persisted", "also"]]
+    assert second_calls == [["fresh"]]
+    assert vector == [9.0]
+    assert vectors == [[4.0], [5.0]]
+
+
+def test_provider_calls_are_capped_and_retried(monkeypatch):
+    import httpx
+    from openai import RateLimitError
+
+    monkeypatch.setattr(embedder_mod.config, "EMBED_CONCURRENCY", 2)
+    monkeypatch.setattr(embedder_mod, "_backoff", lambda attempt: 0)
+    gen, _ = _generator(monkeypatch)
+    response = httpx.Response(429, request=httpx.Request("POST", "http://test"))
+    state = {"running": 0, "peak": 0, "failures": 1}
+
+    async def call():
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        if state["failures"]:
+            state["failures"] -= 1
+            raise RateLimitError("slow down", response=response, body=None)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(gen._call_provider(call) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["ok"] * 5
+    assert state["peak"] == 2
+
+
+def test_openai_response_is_decoded_from_raw_base64(monkeypatch):
+    import base64
+    import json
+
+    import httpx
+    from openai import AsyncOpenAI
+
+    def handler(request):
+        body = json.loads(request.content)
+        assert body["encoding_format"] == "base64"
+        data = [
+            {
+                "object": "embedding",
+                "index": i,
+                "embedding": base64.b64encode(
+                    np.full(3, len(text), dtype=np.float32).tobytes()
+                ).decode(),
+            }
+            for i, text in enumerate(body["input"])
+        ]
+        payload = {"object": "list", "data": data[::-1], "model": body["model"],
+                   "usage": {"prompt_tokens": 11, "total_tokens": 11}}
+        return httpx.Response(200, json=payload)
+
+    gen, _ = _generator(monkeypatch)
+    gen.client = AsyncOpenAI(
+        api_key="test", base_url="http://test/v1",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    vectors, tokens = asyncio.run(gen._embed_openai_compatible(["ab", "abcd"]))
+    assert [v.tolist() for v in vectors] == [[2.0] * 3, [4.0] * 3]
+    assert tokens == 11
+
+
+def test_flush_failure_reaches_every_waiter(monkeypatch):
+    gen, calls = _generator(monkeypatch)
+
+    async def broken_store_get(texts):
+        raise RuntimeError("store down")
+
+    gen._store_get = broken_store_get
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                gen.generate_embedding("alpha"),
+                gen.generate_embedding("beta"),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+    results = asyncio.run(run())
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+    assert calls == []
+
+
+def test_cancelled_flush_cancels_waiters(monkeypatch):
+    gen, _ = _generator(monkeypatch)
+    started = []
+
+    async def slow_embed(texts):
+        started.append(texts)
+        await asyncio.sleep(10)
+
+    gen._embed_fn = slow_embed
+
+    async def run():
+        waiter = asyncio.ensure_future(gen.generate_embedding("alpha"))
+        while not started:
+            await asyncio.sleep(0.001)
+        for task in list(gen._flush_tasks):
+            task.cancel()
+        return await asyncio.wait_for(asyncio.gather(waiter, return_exceptions=True), timeout=1)
+
+    (result,) = asyncio.run(run())
+    assert isinstance(result, asyncio.CancelledError)
+
+
+def test_per_loop_state_is_dropped_for_closed_loops(monkeypatch):
+    import gc
+
+    monkeypatch.setattr(embedder_mod.config, "EMBED_CONCURRENCY", 1)
+    gen, _ = _generator(monkeypatch)
+
+    async def hold():
+        async with gen._semaphore():
+            await asyncio.sleep(0)
+
+    async def use():
+        # Con contención el Semaphore queda ligado (referencia fuerte) a su loop
+        await asyncio.gather(hold(), hold(), gen.generate_embedding("alpha"))
+
+    for _ in range(3):
+        asyncio.run(use())
+    gc.collect()
+    assert len(gen._semaphores) <= 1
+    assert len(gen._pending) == 0
@@ -15,7 +15,7 @@ for l in labels:
     print(f"  {l['label']}: {l['count']}")
 
 eps = s.run(
-    "MATCH (e) WHERE 'Episodic' IN labels(e) RETURN e.name AS name, e.source_description AS src ORDER BY e.created_at"
+    "MATCH (e:Episodic) RETURN e.name AS name, e.source_description AS src ORDER BY e.created_at"
 ).data()
 print(f"\nEpisodes ({len(eps)}):")
 for e in eps:
@@ -9,7 +9,7 @@ with d.session(database="neo4j") as s:
     n_rels = s.run("MATCH ()-[r]->() RETURN count(r) AS c").single()["c"]
     labels = s.run("MATCH (n) UNWIND labels(n) AS l RETURN l, count(*) AS c ORDER BY c DESC").data()
     episodes = s.run(
-        "MATCH (e) WHERE 'Episodic' IN labels(e) "
+        "MATCH (e:Episodic) "
         "RETURN e.name AS name, e.group_id AS group ORDER BY e.created_at"
     ).data()
 
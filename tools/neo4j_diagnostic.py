@@ -67,7 +67,7 @@ async def run_diagnostic():
         print("EPISODIC NODES (ingested documents)")
         print("-" * 40)
         result = await session.run(
-            "MATCH (e) WHERE 'Episodic' IN labels(e) "
+            "MATCH (e:Episodic) "
             "RETURN e.name AS name, e.created_at AS created, e.group_id AS group_id "
             "ORDER BY e.created_at"
         )
@@ -100,7 +100,7 @@ async def run_diagnostic():
         print("SAMPLE EDGES (top 20)")
         print("-" * 40)
         result = await session.run(
-            "MATCH (a)-[r]->(b) WHERE 'Entity' IN labels(a) AND 'Entity' IN labels(b) "
+            "MATCH (a:Entity)-[r]->(b:Entity) "
             "RETURN a.name AS from_name, type(r) AS rel, b.name AS to_name, "
             "r.fact AS fact "
             "LIMIT 20"
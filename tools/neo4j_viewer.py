@@ -42,29 +42,39 @@ def get_driver():
     return GraphDatabase.driver(NEO4J_URI, auth=neo4j.basic_auth(NEO4J_USER, NEO4J_PASSWORD))
 
 
-def get_stats(driver):
-    with driver.session(database="neo4j") as session:
-        node_count = session.run("MATCH (n) RETURN count(n) AS c").single()["c"]
-        rel_count = session.run("MATCH ()-[r]->() RETURN count(r) AS c").single()["c"]
+def _read_stats(tx):
+    node_count = tx.run("MATCH (n) RETURN count(n) AS c").single()["c"]
+    rel_count = tx.run("MATCH ()-[r]->() RETURN count(r) AS c").single()["c"]
 
-        labels = session.run(
-            "MATCH (n) UNWIND labels(n) AS label "
-            "RETURN label, count(*) AS count ORDER BY count DESC"
-        ).data()
+    labels = tx.run(
+        "MATCH (n) UNWIND labels(n) AS label "
+        "RETURN label, count(*) AS count ORDER BY count DESC"
+    ).data()
 
-        rel_types = session.run(
-            "MATCH ()-[r]->() RETURN type(r) AS type, count(*) AS count ORDER BY count DESC"
-        ).data()
+    rel_types = tx.run(
+        "MATCH ()-[r]->() RETURN type(r) AS type, count(*) AS count ORDER BY count DESC"
+    ).data()
 
     return node_count, rel_count, labels, rel_types
 
 
-def get_episodes(driver):
+def get_stats(driver):
+    # One read transaction for the four queries instead of four auto-commit ones
+    with driver.session(database="neo4j") as session:
+        return session.execute_read(_read_stats)
+
+
+EPISODES_PAGE_SIZE = 50
+
+
+def get_episodes(driver, skip=0, limit=EPISODES_PAGE_SIZE):
+    # :Episodic label scan + SKIP/LIMIT so only one page crosses the wire
     with driver.session(database="neo4j") as session:
         return session.run(
-            "MATCH (e) WHERE 'Episodic' IN labels(e) "
+            "MATCH (e:Episodic) "
             "RETURN e.name AS name, e.created_at AS created, e.group_id AS group_id "
-            "ORDER BY e.created_at"
+            "ORDER BY e.created_at SKIP $skip LIMIT $limit",
+            skip=skip, limit=limit,
         ).data()
 
 
@@ -301,9 +311,19 @@ def main():
 
     # ── Episodes Tab ─────────────────────────────────────────────────────────
     with tab_episodes:
-        episodes = get_episodes(driver)
+        n_pages = max(1, -(-episode_count // EPISODES_PAGE_SIZE))
+        page = min(st.session_state.setdefault("ep_page", 0), n_pages - 1)
+        episodes = get_episodes(driver, skip=page * EPISODES_PAGE_SIZE) if episode_count else []
         if episodes:
-            st.subheader(f"Ingested Episodes ({len(episodes)})")
+            st.subheader(f"Ingested Episodes ({episode_count})")
+            prev_col, info_col, next_col = st.columns([1, 2, 1])
+            if prev_col.button("Previous", disabled=page == 0):
+                st.session_state["ep_page"] = page - 1
+                st.rerun()
+            info_col.caption(f"Page {page + 1} of {n_pages}")
+            if next_col.button("Next", disabled=page >= n_pages - 1):
+                st.session_state["ep_page"] = page + 1
+                st.rerun()
             for ep in episodes:
                 with st.expander(f"{ep['name'] or 'unnamed'}", expanded=False):
                     st.json(ep)
@@ -315,16 +335,18 @@ def main():
         col_a, col_b = st.columns(2)
         with col_a:
             st.subheader("Node Labels")
-            for l in labels:
-                color = LABEL_COLORS.get(l["label"], DEFAULT_COLOR)
-                st.markdown(
-                    f'<span style="color:{color}; font-weight:600">{l["label"]}</span>: {l["count"]}',
-                    unsafe_allow_html=True,
-                )
+            # One markdown element per list instead of one per row
+            st.markdown(
+                "<br>".join(
+                    f'<span style="color:{LABEL_COLORS.get(l["label"], DEFAULT_COLOR)}; '
+                    f'font-weight:600">{l["label"]}</span>: {l["count"]}'
+                    for l in labels
+                ),
+                unsafe_allow_html=True,
+            )
         with col_b:
             st.subheader("Relationship Types")
-            for r in rel_types:
-                st.markdown(f'`{r["type"]}`: {r["count"]}')
+            st.markdown("  \n".join(f'`{r["type"]}`: {r["count"]}' for r in rel_types))
 
     # ── Custom Query Tab ─────────────────────────────────────────────────────
     with tab_query: